@@ -1,18 +1,10 @@
 import argparse
 import pathlib
 
-from hpsdecode import load_hps
-
-
-def format_bytes(size: int) -> str:
-    """Format a byte size into a human-readable string."""
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size < 1024:
-            return f"{size:.2f} {unit}"
+import numpy as np
 
-        size /= 1024
-
-    return f"{size:.2f} TB"
+from hpsdecode import load_hps
+from hpsdecode._util import format_bytes
 
 
 def main() -> None:
@@ -54,9 +46,7 @@ def main() -> None:
     print(f"  Texture Coordinates: {'Yes' if mesh.uv.size > 0 else 'No'}")
 
     if mesh.num_vertices > 0:
-        bounds_min = mesh.vertices.min(axis=0)
-        bounds_max = mesh.vertices.max(axis=0)
-        dimensions = bounds_max - bounds_min
+        dimensions = np.ptp(mesh.vertices, axis=0)
 
         print("\n[Dimensions]")
         print(f"  Bounds: {dimensions[0]:.3f} x {dimensions[1]:.3f} x {dimensions[2]:.3f}")
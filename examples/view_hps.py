@@ -1,5 +1,5 @@
 import argparse
-import io
+import concurrent.futures
 import pathlib
 
 import numpy as np
@@ -10,87 +10,123 @@ from PIL import Image
 
 from hpsdecode import load_hps
 from hpsdecode.mesh import Spline
+from hpsdecode.texture import deduplicate_vertices_for_uv, load_texture_image
 
 
-def convert_bgr_to_rgb(image_data: bytes) -> Image.Image:
+def convert_bgr_to_rgb(image_data: bytes, flip_v: bool = False) -> Image.Image:
     """Convert BGR image data to RGB PIL Image.
 
     :param image_data: The raw image bytes (JPEG or PNG in BGR format).
+    :param flip_v: Whether to also flip the image vertically.
     :return: A PIL Image in RGB format.
     """
-    img = Image.open(io.BytesIO(image_data))
-    if img.mode != "RGB":
-        img = img.convert("RGB")
+    return load_texture_image(image_data, flip_vertical=flip_v)
 
-    r, g, b = img.split()
-    return Image.merge("RGB", (b, g, r))
 
+def align_z_to_directions(directions: npt.NDArray[np.floating]) -> npt.NDArray[np.floating]:
+    """Compute the rotations that align the Z axis with each of the given unit directions.
 
-def create_cylinder_mesh(
-    start_point: npt.NDArray[np.floating],
-    end_point: npt.NDArray[np.floating],
-    radius: float,
-    slices: int = 32,
-) -> trimesh.Trimesh:
-    """Create a cylinder mesh between two points.
-
-    :param start_point: The starting point of the cylinder.
-    :param end_point: The ending point of the cylinder.
-    :param radius: The radius of the cylinder.
-    :param slices: The number of slices around the cylinder circumference.
-    :return: A Trimesh representing the cylinder.
+    :param directions: The unit direction vectors (N, 3).
+    :return: The rotation matrices (N, 3, 3).
     """
-    direction = end_point - start_point
-    height = np.linalg.norm(direction)
-    if height < 1e-6:
-        return trimesh.Trimesh()
+    num_directions = directions.shape[0]
+
+    axes = np.cross([0.0, 0.0, 1.0], directions)
+    sines = np.linalg.norm(axes, axis=1)
+    cosines = directions[:, 2]
+
+    skew = np.zeros((num_directions, 3, 3))
+    skew[:, 0, 1] = -axes[:, 2]
+    skew[:, 0, 2] = axes[:, 1]
+    skew[:, 1, 0] = axes[:, 2]
+    skew[:, 1, 2] = -axes[:, 0]
+    skew[:, 2, 0] = -axes[:, 1]
+    skew[:, 2, 1] = axes[:, 0]
 
-    cylinder = trimesh.creation.cylinder(radius=radius, height=height, sections=slices)
+    parallel = sines < 1e-8
+    factors = np.zeros(num_directions)
+    factors[~parallel] = (1.0 - cosines[~parallel]) / sines[~parallel] ** 2
 
-    z_axis = np.array([0.0, 0.0, 1.0])
-    direction_normalized = direction / height
+    rotations = np.eye(3) + skew + (skew @ skew) * factors[:, np.newaxis, np.newaxis]
 
-    rotation_matrix = trimesh.geometry.align_vectors(z_axis, direction_normalized)
-    cylinder.apply_transform(rotation_matrix)
+    # Directions (anti-)parallel to Z have no rotation axis; flip around X when pointing down.
+    rotations[parallel & (cosines < 0)] = np.diag([1.0, -1.0, -1.0])
 
-    center = (start_point + end_point) / 2.0
-    cylinder.apply_translation(center)
+    return rotations
 
-    return cylinder
 
+def compute_spline_colors(splines: list[Spline]) -> npt.NDArray[np.uint8]:
+    """Unpack the packed RGB colors of all splines at once.
 
-def create_spline_mesh(spline: Spline, slices: int = 32) -> trimesh.Trimesh:
+    :param splines: The splines whose colors to unpack.
+    :return: The RGBA colors (N, 4).
+    """
+    # Colors may be stored as signed values, so only their low 32 bits are kept.
+    packed = np.fromiter((spline.color & 0xFFFFFFFF for spline in splines), dtype=np.uint32, count=len(splines))
+
+    colors = np.empty((len(splines), 4), dtype=np.uint8)
+    colors[:, 0] = (packed >> 16) & 0xFF
+    colors[:, 1] = (packed >> 8) & 0xFF
+    colors[:, 2] = packed & 0xFF
+    colors[:, 3] = 255
+
+    return colors
+
+
+def create_spline_mesh(
+    spline: Spline,
+    slices: int = 32,
+    color_rgba: npt.NDArray[np.uint8] | None = None,
+) -> trimesh.Trimesh:
     """Create a mesh representation of a spline as connected cylinders.
 
     :param spline: The spline to convert to a mesh.
     :param slices: The number of slices around each cylinder circumference.
+    :param color_rgba: The precomputed RGBA color of the spline. Unpacked from the spline if omitted.
     :return: A trimesh representing the spline.
     """
     if spline.num_control_points < 2:
         return trimesh.Trimesh()
 
-    meshes = []
-    control_points = spline.control_points
+    control_points = spline.control_points.astype(np.float64)
+    start_points = control_points[:-1]
+    end_points = control_points[1:]
 
-    for i in range(len(control_points) - 1):
-        cylinder = create_cylinder_mesh(control_points[i], control_points[i + 1], spline.radius, slices)
-        if cylinder.vertices.size > 0:
-            meshes.append(cylinder)
+    if spline.is_cyclic:
+        start_points = np.vstack([start_points, control_points[-1:]])
+        end_points = np.vstack([end_points, control_points[:1]])
 
-    if spline.is_cyclic and len(control_points) >= 2:
-        cylinder = create_cylinder_mesh(control_points[-1], control_points[0], spline.radius, slices)
-        if cylinder.vertices.size > 0:
-            meshes.append(cylinder)
+    directions = end_points - start_points
+    heights = np.linalg.norm(directions, axis=1)
 
-    if not meshes:
+    valid = heights >= 1e-6
+    if not valid.any():
         return trimesh.Trimesh()
 
-    r = (spline.color >> 16) & 0xFF
-    g = (spline.color >> 8) & 0xFF
-    b = spline.color & 0xFF
+    directions = directions[valid] / heights[valid, np.newaxis]
+    heights = heights[valid]
+    centers = (start_points[valid] + end_points[valid]) / 2.0
+
+    template = trimesh.creation.cylinder(radius=spline.radius, height=1.0, sections=slices)
+    rotations = align_z_to_directions(directions)
+
+    num_segments = len(heights)
+    verts_per_cylinder = template.vertices.shape[0]
+    faces_per_cylinder = template.faces.shape[0]
+
+    vertices = np.empty((num_segments * verts_per_cylinder, 3), dtype=np.float32)
+    faces = np.empty((num_segments * faces_per_cylinder, 3), dtype=np.int32)
+
+    for i in range(num_segments):
+        scaled = template.vertices * [1.0, 1.0, heights[i]]
+        vertices[i * verts_per_cylinder : (i + 1) * verts_per_cylinder] = scaled @ rotations[i].T + centers[i]
+        faces[i * faces_per_cylinder : (i + 1) * faces_per_cylinder] = template.faces + i * verts_per_cylinder
+
+    if color_rgba is None:
+        color_rgba = compute_spline_colors([spline])[0]
 
-    combined = trimesh.util.concatenate(meshes)
-    combined.visual.vertex_colors = np.array([r, g, b, 255], dtype=np.uint8)
+    combined = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+    combined.visual.vertex_colors = color_rgba
 
     return combined
 
@@ -109,44 +145,17 @@ def create_texture_visual(
     :param texture_data: The raw texture image data (BGR format).
     :return: A new trimesh with duplicated vertices at UV seams.
     """
-    texture_image = convert_bgr_to_rgb(texture_data)
-    texture_image = texture_image.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
-
-    num_faces = faces.shape[0]
-    uv_coords = uv_coords.reshape(num_faces, 3, 2)
-
-    vertex_uv_map: dict[tuple[int, tuple[float, float]], int] = {}
-    new_vertices = []
-    new_uvs = []
-    new_faces = []
-
-    for face_idx, face in enumerate(faces):
-        new_face = []
-        for corner_idx in range(3):
-            vertex_idx = face[corner_idx]
-            uv = tuple(uv_coords[face_idx, corner_idx])
-
-            key = (vertex_idx, uv)
-            if key not in vertex_uv_map:
-                unique_idx = len(new_vertices)
-                vertex_uv_map[key] = unique_idx
-                new_vertices.append(vertices[vertex_idx])
-                new_uvs.append(uv)
-
-            new_face.append(vertex_uv_map[key])
-
-        new_faces.append(new_face)
+    texture_image = convert_bgr_to_rgb(texture_data, flip_v=True)
 
-    new_vertices = np.array(new_vertices, dtype=np.float32)
-    new_uvs = np.array(new_uvs, dtype=np.float32)
-    new_faces = np.array(new_faces, dtype=np.int32)
+    new_vertices, new_uvs, new_faces = deduplicate_vertices_for_uv(vertices, faces, uv_coords.reshape(-1, 3, 2))
 
     material = trimesh.visual.material.SimpleMaterial(image=texture_image)
     visual = trimesh.visual.TextureVisuals(uv=new_uvs, material=material)
 
     return trimesh.Trimesh(
         vertices=new_vertices,
-        faces=new_faces,
+        # Trimesh stores faces as int64.
+        faces=new_faces.astype(np.int64),
         visual=visual,
         process=False,
     )
@@ -207,8 +216,17 @@ def main() -> None:
     if args.show_splines and mesh.has_splines:
         print(f"Creating spline visualization ({len(mesh.splines)} splines)...")
 
-        for idx, spline in enumerate(mesh.splines):
-            spline_mesh = create_spline_mesh(spline)
+        colors = compute_spline_colors(mesh.splines)
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            spline_meshes = list(
+                executor.map(
+                    lambda spline, color: create_spline_mesh(spline, color_rgba=color),
+                    mesh.splines,
+                    colors,
+                )
+            )
+
+        for idx, spline_mesh in enumerate(spline_meshes):
             if spline_mesh.vertices.size > 0:
                 scene.add_geometry(spline_mesh, node_name=f"spline_{idx}")
 
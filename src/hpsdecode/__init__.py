@@ -1,5 +1,7 @@
 """A library for decoding HIMSA packed standard (HPS) files."""
 
+from __future__ import annotations
+
 __all__ = [
     "ExportFormat",
     "HPSMesh",
@@ -11,8 +13,49 @@ __all__ = [
     "load_hps",
 ]
 
-from hpsdecode.exceptions import HPSParseError, HPSSchemaError
-from hpsdecode.export import ExportFormat, export_mesh
-from hpsdecode.loader import load_hps
-from hpsdecode.mesh import HPSMesh, HPSPackedScan
-from hpsdecode.schemas import SUPPORTED_SCHEMAS
+import importlib
+import typing as t
+
+if t.TYPE_CHECKING:
+    from hpsdecode.exceptions import HPSParseError, HPSSchemaError
+    from hpsdecode.export import ExportFormat, export_mesh
+    from hpsdecode.loader import load_hps
+    from hpsdecode.mesh import HPSMesh, HPSPackedScan
+    from hpsdecode.schemas import SUPPORTED_SCHEMAS
+
+#: Mapping of public attribute names to the modules that define them, imported on first access.
+_LAZY_ATTRIBUTES: t.Final[dict[str, str]] = {
+    "ExportFormat": "hpsdecode.export",
+    "HPSMesh": "hpsdecode.mesh",
+    "HPSPackedScan": "hpsdecode.mesh",
+    "HPSParseError": "hpsdecode.exceptions",
+    "HPSSchemaError": "hpsdecode.exceptions",
+    "SUPPORTED_SCHEMAS": "hpsdecode.schemas",
+    "export_mesh": "hpsdecode.export",
+    "load_hps": "hpsdecode.loader",
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    """Import public attributes on first access.
+
+    :param name: The name of the attribute to resolve.
+    :return: The resolved attribute.
+    :raises AttributeError: If the attribute does not exist.
+    """
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public attributes of the package.
+
+    :return: The names of the module globals and public attributes.
+    """
+    return sorted({*globals(), *__all__})
@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import argparse
 import os
+import string
 import sys
+import typing as t
 from pathlib import Path
 
-from hpsdecode import load_hps
+from hpsdecode._util import format_bytes
 from hpsdecode.exceptions import HPSEncryptionError, HPSParseError, HPSSchemaError
-from hpsdecode.export import ExportFormat
-from hpsdecode.export.obj import MaterialConfig
+
+if t.TYPE_CHECKING:
+    from hpsdecode.export.obj import MaterialConfig
 
 
 def load_encryption_key(key_arg: str | None) -> bytes | None:
@@ -37,27 +40,19 @@ def load_encryption_key(key_arg: str | None) -> bytes | None:
     if key_arg.startswith(("0x", "0X")):
         key_arg = key_arg[2:]
 
-    try:
+    if is_hex_string(key_arg):
         return bytes.fromhex(key_arg)
-    except ValueError:
-        pass
 
     return key_arg.encode("iso-8859-1")
 
 
-def format_bytes(size: int) -> str:
-    """Format a byte size into a human-readable string.
+def is_hex_string(value: str) -> bool:
+    """Check whether a string can be decoded as a sequence of hexadecimal bytes.
 
-    :param size: The size in bytes.
-    :return: A formatted string with appropriate units (B, KB, MB, GB, TB).
+    :param value: The string to check.
+    :return: Whether the string consists of an even number of hexadecimal digits.
     """
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size < 1024:
-            return f"{size:.2f} {unit}"
-
-        size /= 1024
-
-    return f"{size:.2f} TB"
+    return len(value) > 0 and len(value) % 2 == 0 and all(c in string.hexdigits for c in value)
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -116,6 +111,15 @@ def create_parser() -> argparse.ArgumentParser:
         help="exclude texture coordinates and texture images from the exported file (OBJ and PLY only)",
     )
 
+    export_parser.add_argument(
+        "--texture-compression",
+        type=int,
+        choices=range(10),
+        default=1,
+        metavar="LEVEL",
+        help="PNG compression level (0-9) for exported texture images, where 0 is fastest (OBJ only, default: 1)",
+    )
+
     export_parser.add_argument(
         "-k",
         "--key",
@@ -187,6 +191,8 @@ def parse_material_config(args: argparse.Namespace) -> MaterialConfig:
     :param args: The parsed command-line arguments.
     :return: A MaterialConfig object with the specified properties.
     """
+    from hpsdecode.export.obj import MaterialConfig
+
     material = MaterialConfig()
 
     def validate_float(value: float, name: str, min_value: float, max_value: float) -> float:
@@ -228,6 +234,9 @@ def export_command(args: argparse.Namespace) -> int:
     :param args: The parsed command-line arguments.
     :return: Exit code (0 for success, non-zero for error).
     """
+    from hpsdecode.export import ExportFormat
+    from hpsdecode.loader import load_hps
+
     try:
         encryption_key = load_encryption_key(args.key)
     except ValueError as e:
@@ -260,6 +269,7 @@ def export_command(args: argparse.Namespace) -> int:
             include_colors=not args.no_colors,
             include_textures=not args.no_textures,
             material=material,
+            texture_compress_level=args.texture_compression,
         )
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
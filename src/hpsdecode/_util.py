@@ -0,0 +1,21 @@
+"""Small formatting helpers shared by the command-line tools."""
+
+from __future__ import annotations
+
+__all__ = ["format_bytes"]
+
+import math
+import typing as t
+
+#: Units used when formatting byte sizes, in increasing powers of 1024.
+BYTE_UNITS: t.Final[tuple[str, ...]] = ("B", "KB", "MB", "GB", "TB")
+
+
+def format_bytes(size: int) -> str:
+    """Format a byte size into a human-readable string.
+
+    :param size: The size in bytes.
+    :return: A formatted string with appropriate units (B, KB, MB, GB, TB).
+    """
+    exponent = min(len(BYTE_UNITS) - 1, int(math.log2(max(size, 1))) // 10)
+    return f"{size / (1 << (10 * exponent)):.2f} {BYTE_UNITS[exponent]}"
@@ -65,6 +65,8 @@ class FaceCommandType(enum.IntEnum):
 class VertexCommand:
     """Base class for vertex commands."""
 
+    __slots__ = ()
+
     #: The type of vertex command
     op: VertexCommandType
 
@@ -72,11 +74,13 @@ class VertexCommand:
 class FaceCommand:
     """Base class for face/facet commands."""
 
+    __slots__ = ()
+
     #: The type of face command
     op: FaceCommandType
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class UseRelativeCoordinates(VertexCommand):
     """Use relative vertex coordinate vectors."""
 
@@ -84,7 +88,7 @@ class UseRelativeCoordinates(VertexCommand):
     op: VertexCommandType = VertexCommandType.USE_RELATIVE_COORDINATES
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class UseAbsoluteCoordinates(VertexCommand):
     """Use absolute vertex coordinate vectors."""
 
@@ -92,7 +96,7 @@ class UseAbsoluteCoordinates(VertexCommand):
     op: VertexCommandType = VertexCommandType.USE_ABSOLUTE_COORDINATES
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DisableTextureCoordinates(VertexCommand):
     """Vertex coordinates after this command cannot contain texture coordinates."""
 
@@ -100,7 +104,7 @@ class DisableTextureCoordinates(VertexCommand):
     op: VertexCommandType = VertexCommandType.DISABLE_TEXTURE_COORDINATES
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EnableTextureCoordinates(VertexCommand):
     """Vertex coordinates after this command must include texture coordinates."""
 
@@ -108,7 +112,7 @@ class EnableTextureCoordinates(VertexCommand):
     op: VertexCommandType = VertexCommandType.ENABLE_TEXTURE_COORDINATES
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SetTextureImage(VertexCommand):
     """Changes the current texture image."""
 
@@ -119,7 +123,7 @@ class SetTextureImage(VertexCommand):
     op: VertexCommandType = VertexCommandType.SET_TEXTURE_IMAGE
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SetBitsPerTextureCoordinate(VertexCommand):
     """Texture coordinates after this command must use a specified number of bits per coordinate."""
 
@@ -130,7 +134,7 @@ class SetBitsPerTextureCoordinate(VertexCommand):
     op: VertexCommandType = VertexCommandType.SET_BITS_PER_TEXTURE_COORDINATE
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SetMultiplier(VertexCommand):
     """Sets the multiplier for vertex coordinates."""
 
@@ -141,7 +145,7 @@ class SetMultiplier(VertexCommand):
     op: VertexCommandType = VertexCommandType.SET_MULTIPLIER
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SetColor(VertexCommand):
     """Vertices after this command must use the specified RGB color."""
 
@@ -158,7 +162,7 @@ class SetColor(VertexCommand):
     op: VertexCommandType = VertexCommandType.SET_COLOR
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class VertexList(FaceCommand):
     """Create new face from current edge, using the next vertex in the global vertex list."""
 
@@ -166,7 +170,7 @@ class VertexList(FaceCommand):
     op: FaceCommandType = FaceCommandType.VERTEX_LIST
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Previous(FaceCommand):
     """Create new facet from current edge, using the vertex at the beginning of the previous edge."""
 
@@ -174,7 +178,7 @@ class Previous(FaceCommand):
     op: FaceCommandType = FaceCommandType.PREVIOUS
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Next(FaceCommand):
     """Create new facet from current edge, using the vertex at the end of the next edge."""
 
@@ -182,7 +186,7 @@ class Next(FaceCommand):
     op: FaceCommandType = FaceCommandType.NEXT
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Ignore(FaceCommand):
     """Ignore current edge, and assign current edge to the next edge in the edge list."""
 
@@ -190,7 +194,7 @@ class Ignore(FaceCommand):
     op: FaceCommandType = FaceCommandType.IGNORE
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Restart(FaceCommand):
     """Create new facet using three next vertices in the global list."""
 
@@ -198,7 +202,7 @@ class Restart(FaceCommand):
     op: FaceCommandType = FaceCommandType.RESTART
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Restart16(FaceCommand):
     """Create new facet using three specified vertices, with 16-bit indices."""
 
@@ -215,7 +219,7 @@ class Restart16(FaceCommand):
     op: FaceCommandType = FaceCommandType.RESTART_16
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Restart32(FaceCommand):
     """Create new facet using three specified vertices, with 32-bit indices."""
 
@@ -232,7 +236,7 @@ class Restart32(FaceCommand):
     op: FaceCommandType = FaceCommandType.RESTART_32
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Absolute16(FaceCommand):
     """Create new facet from current edge using specified vertex, with 16-bit index."""
 
@@ -243,7 +247,7 @@ class Absolute16(FaceCommand):
     op: FaceCommandType = FaceCommandType.ABSOLUTE_16
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Absolute32(FaceCommand):
     """Create new facet from current edge using specified vertex, with 32-bit index."""
 
@@ -254,7 +258,7 @@ class Absolute32(FaceCommand):
     op: FaceCommandType = FaceCommandType.ABSOLUTE_32
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Remove(FaceCommand):
     """Remove edge from the current edge list, and assign current edge to the next edge in the list."""
 
@@ -262,7 +266,7 @@ class Remove(FaceCommand):
     op: FaceCommandType = FaceCommandType.REMOVE
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class IncreaseVertexListPointer(FaceCommand):
     """Increase the vertex list pointer by one without creating a face."""
 
@@ -12,8 +12,8 @@ __all__ = [
 
 import abc
 import os
-import struct
 
+import numpy as np
 from Crypto.Cipher import Blowfish
 
 from hpsdecode.exceptions import HPSEncryptionError
@@ -25,17 +25,16 @@ def swap_endianness(data: bytes) -> bytes:
     :param data: The input data (length must be multiple of 8).
     :return: The data with swapped endianness.
     """
-    result = bytearray(len(data))
+    # Swapping both words of every block is the same as byte-swapping every 32-bit word; a trailing partial block is
+    # kept as is.
+    num_block_bytes = len(data) - len(data) % 8
+    words = np.frombuffer(data, dtype="<u4", count=num_block_bytes // 4)
 
-    for i in range(0, len(data), 8):
-        block = data[i : i + 8]
-        if len(block) == 8:
-            left, right = struct.unpack("<II", block)
-            result[i : i + 8] = struct.pack(">II", left, right)
-        else:
-            result[i : i + len(block)] = block
+    swapped = words.byteswap().tobytes()
+    if num_block_bytes == len(data):
+        return swapped
 
-    return bytes(result)
+    return swapped + data[num_block_bytes:]
 
 
 def scramble_key(key: bytes) -> bytes:
@@ -172,6 +171,9 @@ class BlowfishDecryptor:
     def decrypt(self, data: bytes, original_size: int | None = None) -> bytes:
         """Decrypt data using Blowfish ECB with endianness correction.
 
+        The data is decrypted in a single buffer with :py:meth:`decrypt_into`, from which the result is then copied
+        once into the returned bytes.
+
         :param data: The encrypted data. Will be padded to 8-byte boundary if needed.
         :param original_size: Original size before padding. If provided,
             output is truncated to this size to remove padding.
@@ -180,15 +182,34 @@ class BlowfishDecryptor:
         if not data:
             return data
 
-        if len(data) % 8 != 0:
-            padding = 8 - (len(data) % 8)
-            data = data + bytes(padding)
-
-        swapped = swap_endianness(data)
-        decrypted = self._cipher.decrypt(swapped)
-        result = swap_endianness(decrypted)
+        output = bytearray(-(-len(data) // 8) * 8)
+        self.decrypt_into(data, output)
 
-        if original_size is not None and original_size < len(result):
+        result = memoryview(output)
+        if original_size is not None and original_size < len(output):
             result = result[:original_size]
 
-        return result
+        return bytes(result)
+
+    def decrypt_into(self, data: bytes, output: bytearray) -> None:
+        """Decrypt data into a preallocated buffer using Blowfish ECB with endianness correction.
+
+        The data is copied into the buffer once and then swapped and decrypted in place, so no intermediate copies
+        are made.
+
+        :param data: The encrypted data.
+        :param output: The buffer to write the decrypted data to. Its length must be the length of the data rounded
+            up to a multiple of 8; the bytes past the data are decrypted as zero padding.
+        :raises ValueError: If the buffer does not have the padded length of the data.
+        """
+        padded_size = -(-len(data) // 8) * 8
+        if len(output) != padded_size:
+            raise ValueError(f"Expected an output buffer of {padded_size} bytes, got {len(output)}.")
+
+        output[: len(data)] = data
+        output[len(data) :] = bytes(padded_size - len(data))
+
+        words = np.frombuffer(output, dtype="<u4")
+        words.byteswap(inplace=True)
+        self._cipher.decrypt(output, output=output)
+        words.byteswap(inplace=True)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-__all__ = ["BaseExporter"]
+__all__ = ["BaseExporter", "write_rows"]
 
 import abc
 import typing as t
@@ -10,8 +10,13 @@ import typing as t
 if t.TYPE_CHECKING:
     import os
 
+    import numpy.typing as npt
+
     from hpsdecode.mesh import HPSMesh
 
+#: The number of rows formatted at once by :py:func:`write_rows`.
+ROW_CHUNK_SIZE: t.Final[int] = 65536
+
 
 class BaseExporter(abc.ABC):
     """Abstract base class for mesh exporters."""
@@ -24,3 +29,36 @@ class BaseExporter(abc.ABC):
         :param output_path: The output file path.
         """
         raise NotImplementedError
+
+
+def _format_rows(template: str, rows: npt.NDArray[t.Any]) -> str:
+    """Format every row of an array with the same printf-style template.
+
+    The template is repeated once per row and applied to all values in a single formatting
+    operation, which avoids the interpreter overhead of formatting and writing row by row.
+
+    :param template: The template for a single row, including its line terminator.
+    :param rows: The values to format of shape (N, K), where K matches the placeholders in the template.
+    :return: The formatted rows.
+    """
+    return (template * len(rows)) % tuple(rows.ravel().tolist())
+
+
+def write_rows(
+    file: t.TextIO,
+    template: str,
+    rows: npt.NDArray[t.Any],
+    chunk_rows: int = ROW_CHUNK_SIZE,
+) -> None:
+    """Format every row of an array with the same printf-style template and write it to a file.
+
+    The rows are formatted in bounded chunks with :py:func:`_format_rows`, so memory stays constant regardless of the
+    number of rows while keeping most of the speed of formatting them at once.
+
+    :param file: The text file to write to.
+    :param template: The template for a single row, including its line terminator.
+    :param rows: The values to format of shape (N, K), where K matches the placeholders in the template.
+    :param chunk_rows: The maximum number of rows to format at once.
+    """
+    for start in range(0, len(rows), chunk_rows):
+        file.write(_format_rows(template, rows[start : start + chunk_rows]))
@@ -34,11 +34,17 @@ class ExportFormat(enum.Enum):
         :raises ValueError: If the extension is not supported.
         """
         ext = Path(path).suffix.lower().lstrip(".")
-        try:
-            return cls(ext)
-        except ValueError:
+
+        export_format = _FORMATS_BY_EXTENSION.get(ext)
+        if export_format is None:
             supported = ", ".join(f.value for f in cls)
-            raise ValueError(f"Unsupported file extension '.{ext}'. Supported: {supported}") from None
+            raise ValueError(f"Unsupported file extension '.{ext}'. Supported: {supported}")
+
+        return export_format
+
+
+#: Mapping of lowercase file extensions (without the dot) to their export format.
+_FORMATS_BY_EXTENSION: t.Final[dict[str, ExportFormat]] = {f.value: f for f in ExportFormat}
 
 
 def export_mesh(
@@ -50,6 +56,7 @@ def export_mesh(
     include_colors: bool = True,
     include_textures: bool = True,
     material: MaterialConfig | None = None,
+    texture_compress_level: int = 1,
 ) -> None:
     """Export an HPS mesh to a file.
 
@@ -61,6 +68,7 @@ def export_mesh(
     :param include_textures: Whether to include textures if available (OBJ only)
         or bake textures to vertex colors (PLY only). Default is ``True``.
     :param material: The material configuration (OBJ only). If ``None``, default values are used.
+    :param texture_compress_level: The zlib compression level (0-9) of the texture image (OBJ only). Default is ``1``.
     :raises ValueError: If the format is unsupported or incompatible with options.
     """
     if export_format is None:
@@ -69,7 +77,12 @@ def export_mesh(
     if export_format == ExportFormat.STL:
         exporter = STLExporter(binary=binary)
     elif export_format == ExportFormat.OBJ:
-        exporter = OBJExporter(material=material, include_colors=include_colors, include_textures=include_textures)
+        exporter = OBJExporter(
+            material=material,
+            include_colors=include_colors,
+            include_textures=include_textures,
+            texture_compress_level=texture_compress_level,
+        )
     elif export_format == ExportFormat.PLY:
         exporter = PLYExporter(binary=binary, include_textures=include_textures)
     else:
@@ -4,16 +4,15 @@ from __future__ import annotations
 
 __all__ = ["MaterialConfig", "OBJExporter"]
 
+import concurrent.futures
 import dataclasses
-import io
 import typing as t
 from pathlib import Path
 
 import numpy as np
-from PIL import Image
 
-from hpsdecode.export.base import BaseExporter
-from hpsdecode.texture import deduplicate_vertices_for_uv, face_colors_to_vertex_colors
+from hpsdecode.export.base import ROW_CHUNK_SIZE, BaseExporter, write_rows
+from hpsdecode.texture import deduplicate_vertices_for_uv, face_colors_to_vertex_colors, load_texture_image
 
 if t.TYPE_CHECKING:
     import os
@@ -58,21 +57,28 @@ class OBJExporter(BaseExporter):
     #: Whether to include textures if available.
     include_textures: bool
 
+    #: The zlib compression level (0-9) of the texture PNG. Lower levels write faster but produce larger files.
+    texture_compress_level: int
+
     def __init__(
         self,
         material: MaterialConfig | None = None,
         include_colors: bool = True,
         include_textures: bool = True,
+        texture_compress_level: int = 1,
     ) -> None:
         """Initialize the OBJ exporter.
 
         :param material: Material configuration for MTL file. If ``None``, default values are used.
         :param include_colors: Whether to include vertex colors if available. Default is ``True``.
         :param include_textures: Whether to include textures if available. Default is ``True``.
+        :param texture_compress_level: The zlib compression level (0-9) of the texture PNG. ``0`` disables compression
+            for the fastest writes. Default is ``1``.
         """
         self.material = material or MaterialConfig()
         self.include_colors = include_colors
         self.include_textures = include_textures
+        self.texture_compress_level = texture_compress_level
 
     def export(self, mesh: HPSMesh, output_path: str | os.PathLike[str]) -> None:
         """Export a mesh to OBJ format.
@@ -115,17 +121,14 @@ class OBJExporter(BaseExporter):
         with path.open("w", encoding="utf-8") as f:
             f.write("# hpsdecode\n")
 
-            for i, v in enumerate(mesh.vertices):
-                if has_colors:
-                    color = vertex_colors[i] / 255.0
-                    f.write(f"v {v[0]:.6f} {v[1]:.6f} {v[2]:.6f} {color[0]:.4f} {color[1]:.4f} {color[2]:.4f}\n")
-                else:
-                    f.write(f"v {v[0]:.6f} {v[1]:.6f} {v[2]:.6f}\n")
+            if has_colors:
+                vertex_rows = np.hstack((mesh.vertices, vertex_colors / 255.0))
+                write_rows(f, "v %.6f %.6f %.6f %.4f %.4f %.4f\n", vertex_rows)
+            else:
+                write_rows(f, "v %.6f %.6f %.6f\n", mesh.vertices)
 
             f.write("\n")
-
-            for face in mesh.faces:
-                f.write(f"f {face[0] + 1} {face[1] + 1} {face[2] + 1}\n")
+            write_rows(f, "f %d %d %d\n", mesh.faces + 1)
 
     def _export_with_textures(self, mesh: HPSMesh, path: Path) -> None:
         """Export mesh with texture mapping.
@@ -140,28 +143,32 @@ class OBJExporter(BaseExporter):
         num_faces = mesh.num_faces
         uv_coords = mesh.uv.reshape(num_faces, 3, 2)
 
-        new_vertices, new_uvs, new_faces = deduplicate_vertices_for_uv(mesh.vertices, mesh.faces, uv_coords)
+        # Pillow releases the GIL while decoding and encoding, so the texture is written in the background
+        # while the geometry is formatted.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            texture_future = executor.submit(self._write_texture_image, mesh.texture_images[0], texture_path)
 
-        with path.open("w", encoding="utf-8") as f:
-            f.write("# hpsdecode\n")
-            f.write(f"mtllib {mtl_path.name}\n\n")
+            new_vertices, new_uvs, new_faces = deduplicate_vertices_for_uv(mesh.vertices, mesh.faces, uv_coords)
 
-            for v in new_vertices:
-                f.write(f"v {v[0]:.6f} {v[1]:.6f} {v[2]:.6f}\n")
+            with path.open("w", encoding="utf-8") as f:
+                f.write("# hpsdecode\n")
+                f.write(f"mtllib {mtl_path.name}\n\n")
 
-            f.write("\n")
+                write_rows(f, "v %.6f %.6f %.6f\n", new_vertices)
+                f.write("\n")
 
-            for uv in new_uvs:
-                f.write(f"vt {uv[0]:.6f} {uv[1]:.6f}\n")
+                write_rows(f, "vt %.6f %.6f\n", new_uvs)
+                f.write("\n")
 
-            f.write("\n")
-
-            f.write(f"usemtl {mtl_name}\n")
-            for face in new_faces:
-                f.write(f"f {face[0] + 1}/{face[0] + 1} {face[1] + 1}/{face[1] + 1} {face[2] + 1}/{face[2] + 1}\n")
+                # Vertices and texture coordinates share indices, so each index is written twice. The faces are
+                # repeated one chunk at a time to keep the doubled array bounded.
+                f.write(f"usemtl {mtl_name}\n")
+                for start in range(0, len(new_faces), ROW_CHUNK_SIZE):
+                    face_rows = np.repeat(new_faces[start : start + ROW_CHUNK_SIZE] + 1, 2, axis=1)
+                    write_rows(f, "f %d/%d %d/%d %d/%d\n", face_rows)
 
-        self._write_mtl_file(mtl_path, mtl_name, texture_path.name)
-        self._write_texture_image(mesh.texture_images[0], texture_path)
+            self._write_mtl_file(mtl_path, mtl_name, texture_path.name)
+            texture_future.result()
 
     def _write_mtl_file(self, mtl_path: Path, material_name: str, texture_filename: str) -> None:
         """Write MTL material definition file.
@@ -199,19 +206,11 @@ class OBJExporter(BaseExporter):
 
         return sanitized or "material"
 
-    @staticmethod
-    def _write_texture_image(texture_data: bytes, texture_path: Path) -> None:
+    def _write_texture_image(self, texture_data: bytes, texture_path: Path) -> None:
         """Write the texture image.
 
         :param texture_data: The raw texture image data (BGR format).
         :param texture_path: The output path for the texture image (PNG format).
         """
-        img = Image.open(io.BytesIO(texture_data))
-        if img.mode != "RGB":
-            img = img.convert("RGB")
-
-        r, g, b = img.split()
-        img = Image.merge("RGB", (b, g, r))
-
-        img = img.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
-        img.save(texture_path, "PNG")
+        img = load_texture_image(texture_data, flip_vertical=True)
+        img.save(texture_path, "PNG", compress_level=self.texture_compress_level)
@@ -4,13 +4,12 @@ from __future__ import annotations
 
 __all__ = ["PLYExporter"]
 
-import struct
 import typing as t
 from pathlib import Path
 
 import numpy as np
 
-from hpsdecode.export.base import BaseExporter
+from hpsdecode.export.base import BaseExporter, write_rows
 from hpsdecode.texture import face_colors_to_vertex_colors, texture_to_vertex_colors
 
 if t.TYPE_CHECKING:
@@ -20,6 +19,15 @@ if t.TYPE_CHECKING:
 
     from hpsdecode.mesh import HPSMesh
 
+#: The binary layout of a vertex record without colors.
+VERTEX_DTYPE: t.Final[np.dtype] = np.dtype([("position", "<f4", 3)])
+
+#: The binary layout of a vertex record with RGB colors.
+VERTEX_DTYPE_WITH_COLORS: t.Final[np.dtype] = np.dtype([("position", "<f4", 3), ("color", "u1", 3)])
+
+#: The binary layout of a triangle record: the vertex count followed by the vertex indices.
+FACE_DTYPE: t.Final[np.dtype] = np.dtype([("count", "u1"), ("indices", "<i4", 3)])
+
 
 class PLYExporter(BaseExporter):
     """Export meshes to PLY format with optional vertex colors."""
@@ -89,21 +97,22 @@ class PLYExporter(BaseExporter):
         """
         has_colors = vertex_colors is not None and vertex_colors.size > 0
 
+        vertex_dtype = VERTEX_DTYPE_WITH_COLORS if has_colors else VERTEX_DTYPE
+        vertex_records = np.empty(mesh.num_vertices, dtype=vertex_dtype)
+        vertex_records["position"] = mesh.vertices
+        if has_colors:
+            vertex_records["color"] = vertex_colors
+
+        face_records = np.empty(mesh.num_faces, dtype=FACE_DTYPE)
+        face_records["count"] = 3
+        face_records["indices"] = mesh.faces
+
         with path.open("wb") as f:
             header = self._generate_header(mesh.num_vertices, mesh.num_faces, has_colors, binary=True)
             f.write(header.encode("ascii"))
 
-            for i in range(mesh.num_vertices):
-                v = mesh.vertices[i]
-                f.write(struct.pack("<fff", v[0], v[1], v[2]))
-
-                if has_colors:
-                    color = vertex_colors[i]
-                    f.write(struct.pack("<BBB", color[0], color[1], color[2]))
-
-            for face in mesh.faces:
-                f.write(struct.pack("<B", 3))
-                f.write(struct.pack("<III", face[0], face[1], face[2]))
+            f.write(vertex_records.tobytes())
+            f.write(face_records.tobytes())
 
     def _export_ascii(
         self,
@@ -123,16 +132,12 @@ class PLYExporter(BaseExporter):
             header = self._generate_header(mesh.num_vertices, mesh.num_faces, has_colors, binary=False)
             f.write(header)
 
-            for i in range(mesh.num_vertices):
-                v = mesh.vertices[i]
-                if has_colors:
-                    color = vertex_colors[i]
-                    f.write(f"{v[0]:.6f} {v[1]:.6f} {v[2]:.6f} {color[0]} {color[1]} {color[2]}\n")
-                else:
-                    f.write(f"{v[0]:.6f} {v[1]:.6f} {v[2]:.6f}\n")
+            if has_colors:
+                write_rows(f, "%.6f %.6f %.6f %d %d %d\n", np.hstack((mesh.vertices, vertex_colors)))
+            else:
+                write_rows(f, "%.6f %.6f %.6f\n", mesh.vertices)
 
-            for face in mesh.faces:
-                f.write(f"3 {face[0]} {face[1]} {face[2]}\n")
+            write_rows(f, "3 %d %d %d\n", mesh.faces)
 
     @staticmethod
     def _generate_header(num_vertices: int, num_faces: int, has_colors: bool, binary: bool) -> str:
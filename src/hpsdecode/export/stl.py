@@ -10,7 +10,7 @@ from pathlib import Path
 
 import numpy as np
 
-from hpsdecode.export.base import BaseExporter
+from hpsdecode.export.base import BaseExporter, write_rows
 
 if t.TYPE_CHECKING:
     import os
@@ -19,6 +19,24 @@ if t.TYPE_CHECKING:
 
     from hpsdecode.mesh import HPSMesh
 
+#: The binary layout of a triangle record: the normal, the three vertices, and the attribute byte count.
+TRIANGLE_DTYPE: t.Final[np.dtype] = np.dtype([
+    ("normal", "<f4", 3),
+    ("vertices", "<f4", (3, 3)),
+    ("attributes", "<u2"),
+])
+
+#: The template of a single ASCII facet, filled with the normal followed by the three vertices.
+ASCII_FACET_TEMPLATE: t.Final[str] = (
+    "  facet normal %.6e %.6e %.6e\n"
+    "    outer loop\n"
+    "      vertex %.6e %.6e %.6e\n"
+    "      vertex %.6e %.6e %.6e\n"
+    "      vertex %.6e %.6e %.6e\n"
+    "    endloop\n"
+    "  endfacet\n"
+)
+
 
 class STLExporter(BaseExporter):
     """Export meshes to STL format (geometry only)."""
@@ -53,25 +71,17 @@ class STLExporter(BaseExporter):
         :param mesh: The mesh to export.
         :param path: The output file path.
         """
-        normals = self._compute_face_normals(mesh.vertices, mesh.faces)
         num_faces = mesh.num_faces
 
+        triangles = np.zeros(num_faces, dtype=TRIANGLE_DTYPE)
+        triangles["vertices"] = mesh.vertices[mesh.faces]
+        triangles["normal"] = self._compute_face_normals(triangles["vertices"])
+
         with path.open("wb") as f:
             header = b"hpsdecode"
             f.write(header.ljust(80, b"\0"))
             f.write(struct.pack("<I", num_faces))
-
-            for i in range(num_faces):
-                normal = normals[i]
-                v0, v1, v2 = mesh.vertices[mesh.faces[i]]
-
-                f.write(struct.pack("<3f", *normal))
-
-                f.write(struct.pack("<3f", *v0))
-                f.write(struct.pack("<3f", *v1))
-                f.write(struct.pack("<3f", *v2))
-
-                f.write(b"\x00\x00")
+            f.write(triangles.tobytes())
 
     def _export_ascii(self, mesh: HPSMesh, path: Path) -> None:
         """Export mesh to ASCII STL format.
@@ -79,44 +89,35 @@ class STLExporter(BaseExporter):
         :param mesh: The mesh to export.
         :param path: The output file path.
         """
-        normals = self._compute_face_normals(mesh.vertices, mesh.faces)
+        corners = mesh.vertices[mesh.faces]
+        normals = self._compute_face_normals(corners)
 
         with path.open("w", encoding="ascii") as f:
             f.write(f"solid {path.stem}\n")
 
-            for i in range(mesh.num_faces):
-                normal = normals[i]
-                v0, v1, v2 = mesh.vertices[mesh.faces[i]]
-
-                f.write(f"  facet normal {normal[0]:.6e} {normal[1]:.6e} {normal[2]:.6e}\n")
-                f.write("    outer loop\n")
-                f.write(f"      vertex {v0[0]:.6e} {v0[1]:.6e} {v0[2]:.6e}\n")
-                f.write(f"      vertex {v1[0]:.6e} {v1[1]:.6e} {v1[2]:.6e}\n")
-                f.write(f"      vertex {v2[0]:.6e} {v2[1]:.6e} {v2[2]:.6e}\n")
-                f.write("    endloop\n")
-                f.write("  endfacet\n")
+            facets = np.hstack((normals, corners.reshape(-1, 9)))
+            write_rows(f, ASCII_FACET_TEMPLATE, facets)
 
             f.write(f"endsolid {path.stem}\n")
 
     @staticmethod
-    def _compute_face_normals(
-        vertices: npt.NDArray[np.floating],
-        faces: npt.NDArray[np.integer],
-    ) -> npt.NDArray[np.floating]:
+    def _compute_face_normals(corners: npt.NDArray[np.floating]) -> npt.NDArray[np.floating]:
         """Compute unit normal vectors for each face.
 
-        :param vertices: The vertices of the mesh of shape (N, 3).
-        :param faces: The face indices of shape (M, 3).
-        :return: The normal vectors for each face of shape (M, 3).
+        :param corners: The corner positions of each face of shape (M, 3, 3).
+        :return: The normal vectors for each face of shape (M, 3), in the same precision as the corners.
         """
-        v0 = vertices[faces[:, 0]]
-        v1 = vertices[faces[:, 1]]
-        v2 = vertices[faces[:, 2]]
+        edge1 = corners[:, 1] - corners[:, 0]
+        edge2 = corners[:, 2] - corners[:, 0]
 
-        normals = np.cross(v1 - v0, v2 - v0)
+        # Writing the cross product per component avoids the temporaries that np.cross allocates.
+        normals = np.empty_like(edge1)
+        normals[:, 0] = edge1[:, 1] * edge2[:, 2] - edge1[:, 2] * edge2[:, 1]
+        normals[:, 1] = edge1[:, 2] * edge2[:, 0] - edge1[:, 0] * edge2[:, 2]
+        normals[:, 2] = edge1[:, 0] * edge2[:, 1] - edge1[:, 1] * edge2[:, 0]
 
-        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
-        lengths = np.maximum(lengths, 1e-10)
-        normals /= lengths
+        lengths = np.sqrt(np.einsum("ij,ij->i", normals, normals))
+        np.maximum(lengths, 1e-10, out=lengths)
+        normals /= lengths[:, np.newaxis]
 
-        return normals.astype(np.float32)
+        return normals
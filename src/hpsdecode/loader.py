@@ -4,7 +4,9 @@ from __future__ import annotations
 
 __all__ = ["load_hps"]
 
-import base64
+import binascii
+import io
+import os
 import typing as t
 import xml.etree.ElementTree as ET
 
@@ -15,36 +17,57 @@ from hpsdecode.mesh import HPSMesh, HPSPackedScan, SchemaType, Spline
 from hpsdecode.schemas import SUPPORTED_SCHEMAS, EncryptedData, ParseContext, get_parser
 
 if t.TYPE_CHECKING:
-    import os
-
     import numpy.typing as npt
 
     from hpsdecode.encryption import EncryptionKeyProvider
 
-#: List of XML paths to search for texture images that may be encrypted.
-TEXTURE_IMAGE_PATHS_ENCRYPTED: t.Final[list[str]] = [
-    ".//TextureData2/TextureImages/AdditionalTextureImage",
-    ".//TextureData/TextureImages/AdditionalTextureImage",
-    ".//PartialTextureData/TextureImages/TextureImage",
+#: The buffer size used when reading HPS files from disk. The parser consumes 64 KiB at a time, so a larger buffer turns
+#: those into fewer, larger sequential reads, which matters on network drives and other slow storage.
+READ_BUFFER_SIZE: t.Final[int] = 1 << 20
+
+#: Locations of texture images in priority order, as ``(container tag, image tag, may be encrypted)``. The container is
+#: the parent of the ``TextureImages`` element; ``None`` matches any container.
+TEXTURE_IMAGE_LOCATIONS: t.Final[list[tuple[str | None, str, bool]]] = [
+    ("TextureData2", "AdditionalTextureImage", True),
+    ("TextureData", "AdditionalTextureImage", True),
+    ("PartialTextureData", "TextureImage", True),
+    (None, "TextureImage", False),
 ]
 
-#: List of XML paths to search for texture images in unencrypted files.
-TEXTURE_IMAGE_PATHS_UNENCRYPTED: t.Final[list[str]] = [
-    ".//TextureImages/TextureImage",
-]
 
+def decode_base64(text: str) -> bytes:
+    """Decode base64-encoded text.
 
-def decode_binary_element(element: ET.Element) -> bytes:
+    :param text: The base64-encoded text.
+    :return: The decoded binary data.
+    :raises HPSParseError: If the text is not valid base64.
+    """
+    # Unlike base64.b64decode, binascii reads the ASCII text in place instead of encoding a copy first. Characters
+    # outside the base64 alphabet, including the surrounding whitespace, are discarded, so stripping would only copy
+    # the payload as well.
+    try:
+        return binascii.a2b_base64(text)
+    except ValueError as e:
+        raise HPSParseError(f"Invalid base64 data: {e}") from e
+
+
+def decode_binary_element(element: ET.Element, *, release_text: bool = False) -> bytes:
     """Decode base64-encoded binary data from an XML element.
 
     :param element: The XML element containing base64-encoded data.
+    :param release_text: Whether to drop the element's text after decoding, so the encoded payload can be freed
+        before the rest of the file is decoded.
     :return: The decoded binary data.
     """
     text = element.text
     if text is None:
         raise HPSParseError(f"Element '{element.tag}' has no binary data")
 
-    return base64.b64decode(text.strip())
+    data = decode_base64(text)
+    if release_text:
+        element.text = None
+
+    return data
 
 
 def should_scramble_key(element: ET.Element) -> bool:
@@ -56,6 +79,24 @@ def should_scramble_key(element: ET.Element) -> bool:
     return element.get("Key") is not None
 
 
+def get_optional_int(element: ET.Element, attribute_name: str) -> int | None:
+    """Get an optional integer attribute from an XML element.
+
+    :param element: The XML element containing the attribute.
+    :param attribute_name: The name of the attribute.
+    :return: The attribute value as an integer, or None if not present or empty.
+    :raises HPSParseError: If the attribute value is not a valid integer.
+    """
+    value = element.get(attribute_name)
+    if not value:
+        return None
+
+    try:
+        return int(value)
+    except ValueError as e:
+        raise HPSParseError(f"Attribute '{attribute_name}' on element '{element.tag}' is not an integer: {e}") from e
+
+
 def extract_original_size(element: ET.Element, size_attribute_name: str = "Base64EncodedBytes") -> int | None:
     """Extract the original size of data from an XML element attribute.
 
@@ -63,20 +104,23 @@ def extract_original_size(element: ET.Element, size_attribute_name: str = "Base6
     :param size_attribute_name: The name of the attribute that contains the original size.
     :return: The original size as an integer, or None if not present.
     """
-    if original_size_attr := element.get(size_attribute_name):
-        return int(original_size_attr)
-
-    return None
+    return get_optional_int(element, size_attribute_name)
 
 
-def extract_encrypted_data(element: ET.Element, size_attribute_name: str = "Base64EncodedBytes") -> EncryptedData:
+def extract_encrypted_data(
+    element: ET.Element,
+    size_attribute_name: str = "Base64EncodedBytes",
+    *,
+    release_text: bool = False,
+) -> EncryptedData:
     """Extract encrypted data from an XML element with metadata.
 
     :param element: The XML element containing encrypted data.
     :param size_attribute_name: The name of the attribute that contains the original size.
+    :param release_text: Whether to drop the element's text after decoding.
     :return: An EncryptedData object containing the data and metadata.
     """
-    data = decode_binary_element(element)
+    data = decode_binary_element(element, release_text=release_text)
     original_size = extract_original_size(element, size_attribute_name)
     use_scrambled_key = should_scramble_key(element)
 
@@ -87,18 +131,21 @@ def extract_binary_data(
     element: ET.Element,
     is_encrypted: bool,
     size_attribute_name: str = "Base64EncodedBytes",
+    *,
+    release_text: bool = False,
 ) -> bytes | EncryptedData:
     """Extract binary data from an XML element, handling encryption if necessary.
 
     :param element: The XML element containing the binary data.
     :param is_encrypted: Whether the data is encrypted.
     :param size_attribute_name: The name of the attribute that contains the original size.
+    :param release_text: Whether to drop the element's text after decoding.
     :return: The binary data as bytes or an EncryptedData object.
     """
     if is_encrypted:
-        return extract_encrypted_data(element, size_attribute_name)
+        return extract_encrypted_data(element, size_attribute_name, release_text=release_text)
 
-    return decode_binary_element(element)
+    return decode_binary_element(element, release_text=release_text)
 
 
 def get_required_child(parent: ET.Element, path: str) -> ET.Element:
@@ -130,25 +177,77 @@ def get_required_text(element: ET.Element) -> str:
     return text
 
 
-def get_property_value(element: ET.Element, property_name: str) -> str:
-    """Get the value attribute from a 'Property' element.
+def collect_property_values(element: ET.Element) -> dict[str, str | None]:
+    """Collect the value attributes of all 'Property' elements below an XML element in a single traversal.
 
     :param element: The XML element.
+    :return: A mapping of property names to their value, or None if the value attribute is missing. If a name occurs
+        more than once, the first occurrence in document order is kept.
+    """
+    properties: dict[str, str | None] = {}
+    for property_element in element.iterfind(".//Property"):
+        name = property_element.get("name")
+        if name is not None:
+            properties.setdefault(name, property_element.get("value"))
+
+    return properties
+
+
+def get_property_value(properties: dict[str, str | None], property_name: str) -> str:
+    """Get the value of a property collected by :py:func:`collect_property_values`.
+
+    :param properties: The collected property values.
     :param property_name: The name of the property to find.
     :return: The property value.
     :raises HPSParseError: If the property or its value is missing.
     """
-    property_element = element.find(f".//Property[@name='{property_name}']")
-    if property_element is None:
+    if property_name not in properties:
         raise HPSParseError(f"Missing 'Property' element with name='{property_name}'")
 
-    value = property_element.get("value")
+    value = properties[property_name]
     if value is None:
         raise HPSParseError(f"Missing 'value' attribute on Property[@name='{property_name}']")
 
     return value
 
 
+def find_texture_images(root: ET.Element) -> list[tuple[ET.Element, bool]]:
+    """Find all texture image elements without searching the XML tree once per location.
+
+    Each image is matched against the first applicable entry of :py:data:`TEXTURE_IMAGE_LOCATIONS`.
+
+    :param root: The root XML element of the HPS file.
+    :return: The texture image elements and whether each may be encrypted, ordered by location priority and then by
+        document order.
+    """
+    # ElementTree has no parent pointers, so look up the image lists below each named container first. Iterating by tag
+    # stays inside the C accelerator, unlike mapping the parent of every element in the tree.
+    container_tags = {
+        images_element: container_tag
+        for container_tag in {tag for tag, _, _ in TEXTURE_IMAGE_LOCATIONS if tag is not None}
+        for container in root.iter(container_tag)
+        for images_element in container.iterfind("TextureImages")
+    }
+    matches: list[list[ET.Element]] = [[] for _ in TEXTURE_IMAGE_LOCATIONS]
+
+    for images_element in root.iter("TextureImages"):
+        if images_element is root:
+            continue
+
+        container_tag = container_tags.get(images_element)
+        for image_element in images_element:
+            for index, (location_tag, image_tag, _) in enumerate(TEXTURE_IMAGE_LOCATIONS):
+                if image_element.tag == image_tag and location_tag in (None, container_tag):
+                    matches[index].append(image_element)
+                    break
+
+    return [
+        (element, encryptable)
+        for (_, _, encryptable), elements in zip(TEXTURE_IMAGE_LOCATIONS, matches, strict=True)
+        for element in elements
+    ]
+
+
 def extract_control_points_packed(data: bytes) -> npt.NDArray[np.floating]:
     """Extract 3D control points from packed binary data (base64-encoded).
 
@@ -174,32 +273,29 @@ def extract_control_points_xml(element: ET.Element) -> npt.NDArray[np.floating]:
     :return: A numpy array of shape (N, 3) containing the control points.
     :raises HPSParseError: If any control point is missing required attributes or if no valid points are found.
     """
-    points: list[tuple[float, float, float]] = []
+    coordinates: list[str | None] = []
 
     for obj in element.findall("Object"):
-        vector = obj.find("Vector[@name='p']")
+        # A plain child scan is much cheaper than evaluating a path predicate for every control point.
+        vector = next((child for child in obj if child.tag == "Vector" and child.get("name") == "p"), None)
         if vector is None:
             raise HPSParseError("Object in ControlPoints is missing Vector[@name='p'] element")
 
-        x_str = vector.get("x")
-        y_str = vector.get("y")
-        z_str = vector.get("z")
-        if x_str is None or y_str is None or z_str is None:
-            raise HPSParseError("Vector element is missing x, y, or z attribute")
+        coordinates += (vector.get("x"), vector.get("y"), vector.get("z"))
 
-        try:
-            x = float(x_str)
-            y = float(y_str)
-            z = float(z_str)
-        except ValueError as e:
-            raise HPSParseError(f"Failed to parse vector coordinates: {e}") from e
+    if not coordinates:
+        raise HPSParseError("ControlPoints element contains no valid control points")
 
-        points.append((x, y, z))
+    if None in coordinates:
+        raise HPSParseError("Vector element is missing x, y, or z attribute")
 
-    if not points:
-        raise HPSParseError("ControlPoints element contains no valid control points")
+    try:
+        # Parse as double first, so values are rounded to float32 exactly like Python's float() would.
+        points = np.array(coordinates, dtype=np.float64)
+    except ValueError as e:
+        raise HPSParseError(f"Failed to parse vector coordinates: {e}") from e
 
-    return np.array(points, dtype=np.float32)
+    return points.astype(np.float32).reshape(-1, 3)
 
 
 def parse_spline(element: ET.Element) -> Spline:
@@ -209,11 +305,13 @@ def parse_spline(element: ET.Element) -> Spline:
     :return: A Spline object containing the parsed data.
     :raises HPSParseError: If required elements or attributes are missing.
     """
-    name = get_property_value(element, "Name")
-    radius_str = get_property_value(element, "Radius")
-    closed_str = get_property_value(element, "Closed")
-    color_str = get_property_value(element, "Color")
-    misc_str = get_property_value(element, "iMisc1")
+    properties = collect_property_values(element)
+
+    name = get_property_value(properties, "Name")
+    radius_str = get_property_value(properties, "Radius")
+    closed_str = get_property_value(properties, "Closed")
+    color_str = get_property_value(properties, "Color")
+    misc_str = get_property_value(properties, "iMisc1")
 
     try:
         radius = float(radius_str)
@@ -228,10 +326,10 @@ def parse_spline(element: ET.Element) -> Spline:
 
     if control_points_packed_element is not None:
         control_points_text = control_points_packed_element.text
-        if control_points_text is None or control_points_text.strip() == "":
+        if not control_points_text or control_points_text.isspace():
             raise HPSParseError("ControlPointsPacked element has no content")
 
-        control_points_data = base64.b64decode(control_points_text.strip())
+        control_points_data = decode_base64(control_points_text)
         control_points = extract_control_points_packed(control_points_data)
     elif control_points_xml_element is not None:
         control_points = extract_control_points_xml(control_points_xml_element)
@@ -273,6 +371,13 @@ def parse_xml(file: str | os.PathLike[str] | t.IO[bytes] | bytes) -> ET.ElementT
     :param file: The path to the HPS file, raw bytes, or a file-like object.
     :return: The parsed XML tree.
     """
+    if isinstance(file, bytes):
+        return ET.parse(io.BytesIO(file))
+
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "rb", buffering=READ_BUFFER_SIZE) as f:
+            return ET.parse(f)
+
     return ET.parse(file)
 
 
@@ -319,45 +424,29 @@ def load_hps(
     vertices_element = get_required_child(data_element, ".//Vertices")
     faces_element = get_required_child(data_element, ".//Facets")
 
-    vertex_data = extract_binary_data(vertices_element, is_encrypted, "base64_encoded_bytes")
-    face_data = decode_binary_element(faces_element)
+    # HPS files consist of a few elements with very large base64 payloads. Each payload's text is released as soon
+    # as it is decoded, so the encoded and decoded copies of the whole file are never held at the same time.
+    vertex_data = extract_binary_data(vertices_element, is_encrypted, "base64_encoded_bytes", release_text=True)
+    face_data = decode_binary_element(faces_element, release_text=True)
 
-    num_vertices = int(vertices_element.get("vertex_count", "0"))
-    num_faces = int(faces_element.get("facet_count", "0"))
-    check_value = vertices_element.get("check_value")
-    default_vertex_color = vertices_element.get("color")
-    default_face_color = faces_element.get("color")
+    num_vertices = get_optional_int(vertices_element, "vertex_count") or 0
+    num_faces = get_optional_int(faces_element, "facet_count") or 0
 
     vertex_colors_data: bytes | EncryptedData | None = None
     vertex_colors_element = root.find(".//VertexColorSets/VertexColorSet")
     if vertex_colors_element is not None:
-        vertex_colors_data = extract_binary_data(vertex_colors_element, is_encrypted)
+        vertex_colors_data = extract_binary_data(vertex_colors_element, is_encrypted, release_text=True)
 
     texture_coords_data: bytes | EncryptedData | None = None
     texture_coords_element = root.find(".//PerVertexTextureCoord")
     if texture_coords_element is not None:
-        texture_coords_data = extract_binary_data(texture_coords_element, is_encrypted)
-
-    texture_images: dict[str, bytes | EncryptedData] = {}
-    seen_elements: set[int] = set()
+        texture_coords_data = extract_binary_data(texture_coords_element, is_encrypted, release_text=True)
 
-    texture_paths = [
-        *((p, True) for p in TEXTURE_IMAGE_PATHS_ENCRYPTED),
-        *((p, False) for p in TEXTURE_IMAGE_PATHS_UNENCRYPTED),
+    texture_images = [
+        extract_binary_data(texture_image_element, is_encrypted and encryptable, release_text=True)
+        for texture_image_element, encryptable in find_texture_images(root)
     ]
 
-    for path, encryptable in texture_paths:
-        for texture_image_element in root.findall(path):
-            element_id = id(texture_image_element)
-            if element_id in seen_elements:
-                continue
-
-            seen_elements.add(element_id)
-            texture_images[f"{path}:{element_id}"] = extract_binary_data(
-                element=texture_image_element,
-                is_encrypted=is_encrypted and encryptable,
-            )
-
     splines = parse_splines(root)
 
     properties: dict[str, t.Any] = {}
@@ -375,13 +464,13 @@ def load_hps(
         face_data=face_data,
         vertex_count=num_vertices,
         face_count=num_faces,
-        default_vertex_color=int(default_vertex_color) if default_vertex_color else None,
-        default_face_color=int(default_face_color) if default_face_color else None,
+        default_vertex_color=get_optional_int(vertices_element, "color"),
+        default_face_color=get_optional_int(faces_element, "color"),
         vertex_colors_data=vertex_colors_data,
         texture_coords_data=texture_coords_data,
-        texture_images=list(texture_images.values()),
+        texture_images=texture_images,
         splines=splines,
-        check_value=int(check_value) if check_value else None,
+        check_value=get_optional_int(vertices_element, "check_value"),
         properties=properties,
     )
 
@@ -7,24 +7,27 @@ __all__ = ["Edge", "HPSMesh", "HPSPackedScan", "SchemaType", "Spline"]
 import dataclasses
 import typing as t
 
-from hpsdecode.export import ExportFormat, export_mesh
+import numpy as np
 
 if t.TYPE_CHECKING:
     import os
 
-    import numpy as np
     import numpy.typing as npt
 
     from hpsdecode.commands import AnyFaceCommand, AnyVertexCommand
+    from hpsdecode.export import ExportFormat
     from hpsdecode.export.obj import MaterialConfig
 
 
 SchemaType: t.TypeAlias = t.Literal["CA", "CB", "CC", "CE"]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Edge:
-    """An edge connecting two vertex indices."""
+    """An edge connecting two vertex indices.
+
+    The decoders track their edge front as plain ``(start, end)`` tuples; this class is kept for API compatibility.
+    """
 
     #: The starting vertex index.
     start: int
@@ -37,7 +40,7 @@ class Edge:
         return f"({self.start} → {self.end})"
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Spline:
     """A 3D spline defined by control points."""
 
@@ -65,7 +68,7 @@ class Spline:
         return int(self.control_points.shape[0])
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class HPSPackedScan:
     """Metadata and commands from a packed HPS scan."""
 
@@ -120,15 +123,15 @@ class HPSPackedScan:
         return self.schema == "CE"
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class HPSMesh:
     """Decoded 3D mesh data."""
 
-    #: Vertex positions as (N, 3) float array.
-    vertices: npt.NDArray[np.floating]
+    #: Vertex positions as (N, 3) float32 array.
+    vertices: npt.NDArray[np.float32]
 
-    #: Face indices as (M, 3) integer array.
-    faces: npt.NDArray[np.integer]
+    #: Face indices as (M, 3) int32 array.
+    faces: npt.NDArray[np.int32]
 
     #: Per-vertex RGB colors as (N, 3) uint8 array, or empty.
     vertex_colors: npt.NDArray[np.uint8]
@@ -145,6 +148,14 @@ class HPSMesh:
     #: The splines associated with the mesh, if any.
     splines: list[Spline] = dataclasses.field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        """Normalize the geometry to contiguous float32 vertices and int32 faces.
+
+        Decoded geometry already has these dtypes, so this only copies meshes built by hand.
+        """
+        self.vertices = np.ascontiguousarray(self.vertices, dtype=np.float32)
+        self.faces = np.ascontiguousarray(self.faces, dtype=np.int32)
+
     @property
     def num_faces(self) -> int:
         """Number of faces in the mesh."""
@@ -189,6 +200,7 @@ class HPSMesh:
         include_colors: bool = True,
         include_textures: bool = True,
         material: MaterialConfig | None = None,
+        texture_compress_level: int = 1,
     ) -> None:
         """Export an HPS mesh to a file.
 
@@ -199,8 +211,12 @@ class HPSMesh:
         :param include_textures: Whether to include textures if available (OBJ only)
             or bake textures to vertex colors (PLY only). Default is ``True``.
         :param material: The material configuration (OBJ only). If ``None``, default values are used.
+        :param texture_compress_level: The zlib compression level (0-9) of the texture image (OBJ only).
+            Default is ``1``.
         :raises ValueError: If the format is unsupported or incompatible with options.
         """
+        from hpsdecode.export import export_mesh
+
         export_mesh(
             self,
             output_path,
@@ -209,4 +225,5 @@ class HPSMesh:
             include_colors=include_colors,
             include_textures=include_textures,
             material=material,
+            texture_compress_level=texture_compress_level,
         )
@@ -13,7 +13,7 @@ if t.TYPE_CHECKING:
     from hpsdecode.mesh import HPSMesh, Spline
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EncryptedData:
     """Container for encrypted data with metadata needed for decryption."""
 
@@ -27,7 +27,7 @@ class EncryptedData:
     use_scrambled_key: bool = False
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ParseContext:
     """Context object containing metadata required for parsing HPS data."""
 
@@ -68,7 +68,7 @@ class ParseContext:
     properties: dict[str, str] = dataclasses.field(default_factory=dict)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ParseResult:
     """Result of parsing HPS binary data."""
 
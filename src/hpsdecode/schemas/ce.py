@@ -4,6 +4,7 @@ from __future__ import annotations
 
 __all__ = ["CESchemaParser"]
 
+import functools
 import hashlib
 import zlib
 
@@ -55,11 +56,12 @@ class CESchemaParser(CCSchemaParser):
         :return: The parsing result containing the decoded mesh and commands.
         """
         key = self._derive_key(context.properties)
+        decryptors: dict[bool, BlowfishDecryptor] = {}
 
-        decrypted_vertex_data = self._decrypt_data(context.vertex_data, key)
+        decrypted_vertex_data = self._decrypt_data(context.vertex_data, key, decryptors)
         if context.check_value is not None:
-            adler = zlib.adler32(decrypted_vertex_data) & 0xFFFFFFFF
-            adler = int.from_bytes(adler.to_bytes(4, "little"), "big")
+            # The check value stores the checksum with its bytes reversed.
+            adler = int.from_bytes(zlib.adler32(decrypted_vertex_data).to_bytes(4, "big"), "little")
 
             if adler != context.check_value:
                 raise HPSEncryptionError(
@@ -68,15 +70,15 @@ class CESchemaParser(CCSchemaParser):
 
         decrypted_texture_coords = None
         if context.texture_coords_data is not None:
-            decrypted_texture_coords = self._decrypt_data(context.texture_coords_data, key)
+            decrypted_texture_coords = self._decrypt_data(context.texture_coords_data, key, decryptors)
 
         decrypted_vertex_colors = None
         if context.vertex_colors_data is not None:
-            decrypted_vertex_colors = self._decrypt_data(context.vertex_colors_data, key)
+            decrypted_vertex_colors = self._decrypt_data(context.vertex_colors_data, key, decryptors)
 
         decrypted_texture_images = []
         for image in context.texture_images:
-            decrypted_texture_images.append(self._decrypt_data(image, key))
+            decrypted_texture_images.append(self._decrypt_data(image, key, decryptors))
 
         decrypted_context = ParseContext(
             properties=context.properties,
@@ -104,25 +106,29 @@ class CESchemaParser(CCSchemaParser):
         if not value:
             return None
 
-        items = [item for item in value.split(";") if item]
-        if not items:
-            return None
-
-        canonical = ";".join(sorted(set(items))) + ";"
-        return hashlib.md5(canonical.encode("utf-8")).hexdigest().upper()
+        return _hash_package_lock_list(value)
 
-    def _decrypt_data(self, data: EncryptedData | bytes, key: bytes) -> bytes:
+    def _decrypt_data(
+        self,
+        data: EncryptedData | bytes,
+        key: bytes,
+        decryptors: dict[bool, BlowfishDecryptor],
+    ) -> bytes:
         """Decrypt data with appropriate key (scrambled or normal).
 
         :param data: The encrypted data (either EncryptedData or raw bytes).
         :param key: The base encryption key.
+        :param decryptors: The decryptors already set up for the base key, keyed by whether they use the scrambled
+            key. Newly created decryptors are added, so the key schedule is computed at most once per key.
         :return: The decrypted data.
         """
         if isinstance(data, bytes):
             return data
 
-        decryption_key = scramble_key(key) if data.use_scrambled_key else key
-        decryptor = BlowfishDecryptor(decryption_key)
+        decryptor = decryptors.get(data.use_scrambled_key)
+        if decryptor is None:
+            decryption_key = scramble_key(key) if data.use_scrambled_key else key
+            decryptor = decryptors[data.use_scrambled_key] = BlowfishDecryptor(decryption_key)
 
         return decryptor.decrypt(data.data, data.original_size)
 
@@ -134,12 +140,32 @@ class CESchemaParser(CCSchemaParser):
         """
         base_key = self._key_provider.get_key(properties)
         encryption_key_id = properties.get(self.HPS_ATTR_ENCRYPTION_KEY_ID)
+        if encryption_key_id and encryption_key_id != self.ENCRYPTION_KEY_ID_3SHAPE_INTERNAL:
+            # Other key ids use the base key as is, so the package lock list does not need to be hashed.
+            return base_key
+
         package_hash = self._compute_package_lock_hash(properties)
+        if not package_hash:
+            return base_key
 
         if not encryption_key_id:
-            return package_hash.encode("iso-8859-1") if package_hash else base_key
+            return package_hash.encode("iso-8859-1")
+
+        return (base_key.decode("iso-8859-1") + package_hash).encode("iso-8859-1")
 
-        if encryption_key_id == self.ENCRYPTION_KEY_ID_3SHAPE_INTERNAL and package_hash:
-            return (base_key.decode("iso-8859-1") + package_hash).encode("iso-8859-1")
 
-        return base_key
+@functools.lru_cache(maxsize=16)
+def _hash_package_lock_list(value: str) -> str | None:
+    """Compute MD5 hash of a normalized package lock list.
+
+    Files from the same installation share their package lock list, so the hashes are cached for batch decoding.
+
+    :param value: The raw package lock list.
+    :return: Uppercase hex MD5 hash or None if the list has no items.
+    """
+    items = [item for item in value.split(";") if item]
+    if not items:
+        return None
+
+    canonical = ";".join(sorted(set(items))) + ";"
+    return hashlib.md5(canonical.encode("utf-8")).hexdigest().upper()
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 __all__ = [
     "decompress_texture_coord",
+    "decompress_texture_coords",
     "parse_texture_coords",
     "face_colors_to_vertex_colors",
     "texture_to_vertex_colors",
     "deduplicate_vertices_for_uv",
+    "load_texture_image",
 ]
 
 import io
@@ -15,12 +17,10 @@ import logging
 import typing as t
 
 import numpy as np
-from PIL import Image
-
-from hpsdecode.binary import BinaryReader
 
 if t.TYPE_CHECKING:
     import numpy.typing as npt
+    from PIL import Image
 
     from hpsdecode.mesh import HPSMesh
 
@@ -39,6 +39,23 @@ _SCALE_INSIDE = 1.0 / 32767.0
 #: Scale factor for [-256, 256] range.
 _SCALE_OUTSIDE = 512.0 / 32767.0
 
+
+def _build_decompress_table() -> npt.NDArray[np.float32]:
+    """Decompress every possible 16-bit component value.
+
+    :return: The decompressed values, indexed by their 16-bit representation.
+    """
+    bits = np.arange(1 << 16)
+    values = (bits & _COORD_MASK).astype(np.float64)
+
+    # Computed in double precision like the scalar path, so both round to the same float32 values.
+    outside = (bits & _OUTSIDE_RANGE_BIT) != 0
+    return np.where(outside, values * _SCALE_OUTSIDE - 256.0, values * _SCALE_INSIDE).astype(np.float32)
+
+
+#: Decompressed value of every 16-bit coordinate component (256 KiB).
+_DECOMPRESS_TABLE: t.Final[npt.NDArray[np.float32]] = _build_decompress_table()
+
 #: Marker value indicating a missing texture coordinate.
 _NO_UV_MARKER = 0xFFFFFFFF
 
@@ -80,6 +97,19 @@ def _decompress_component(bits: int) -> float:
         return value * _SCALE_INSIDE
 
 
+def decompress_texture_coords(compressed: npt.NDArray[np.uint32]) -> npt.NDArray[np.float32]:
+    """Decompress many texture coordinates from their 32-bit representation at once.
+
+    This is the vectorized form of :py:func:`decompress_texture_coord`.
+
+    :param compressed: The 32-bit compressed coordinates (N,).
+    :return: The (u, v) coordinates as an (N, 2) float array.
+    """
+    # Each little-endian word holds u in its low half and v in its high half.
+    components = np.ascontiguousarray(compressed, dtype="<u4").view("<u2").reshape(-1, 2)
+    return _DECOMPRESS_TABLE[components]
+
+
 def parse_texture_coords(data: bytes, num_vertices: int, faces: npt.NDArray[np.integer]) -> npt.NDArray[np.floating]:
     """Parse texture coordinates.
 
@@ -96,48 +126,112 @@ def parse_texture_coords(data: bytes, num_vertices: int, faces: npt.NDArray[np.i
     :return: Array of UV coordinates with shape (num_faces * 3, 2).
     :raises ValueError: If data is malformed or insufficient.
     """
-    reader = BinaryReader(data)
     num_faces = faces.shape[0]
-
     face_corners = faces.ravel()
-    vertex_corners: list[list[int]] = [[] for _ in range(num_vertices)]
-    for corner_idx, vertex_idx in enumerate(face_corners):
-        vertex_corners[vertex_idx].append(corner_idx)
 
-    uvs = np.zeros((num_faces * 3, 2), dtype=np.float32)
+    # Group the corners by vertex in a CSR layout. The corners of each vertex must stay in face order, which is the
+    # order their coordinates are stored in; packing the corner index below the vertex makes a plain sort stable.
+    corner_counts = np.bincount(face_corners, minlength=num_vertices)
+    sort_keys = (face_corners.astype(np.uint64) << np.uint64(32)) | np.arange(face_corners.shape[0], dtype=np.uint64)
+    sort_keys.sort()
+    corner_order = (sort_keys & np.uint64(0xFFFFFFFF)).astype(np.intp)
+    corner_vertices = (sort_keys >> np.uint64(32)).astype(np.intp)
+
+    # First pass: walk only the flag bytes to find where the coordinates of each vertex start.
+    flag_offsets = np.array(_scan_flag_offsets(data, corner_counts.tolist()[:num_vertices]), dtype=np.intp)
+    data_bytes = np.frombuffer(data, dtype=np.uint8)
+    flags = data_bytes[flag_offsets]
+    coord_offsets = flag_offsets + 1
+
+    # Second pass: gather the compressed coordinate of every corner, in vertex-grouped order.
+    vertex_starts = np.cumsum(corner_counts) - corner_counts
+    corner_ranks = np.arange(corner_order.shape[0]) - vertex_starts[corner_vertices]
+    corner_ranks[flags[corner_vertices] == 1] = 0
+
+    byte_offsets = coord_offsets[corner_vertices] + 4 * corner_ranks
+
+    # The coordinates are not 4-byte aligned, so each little-endian word is assembled from its bytes in place.
+    compressed_coords = data_bytes[byte_offsets].astype(np.uint32)
+    for shift in (8, 16, 24):
+        byte_offsets += 1
+        compressed_coords |= data_bytes[byte_offsets].astype(np.uint32) << shift
+
+    # Every corner is written, so the output does not need to be zeroed first. Decoding the missing markers along
+    # with the rest is cheaper than compressing them out; they are reset to zero afterwards.
+    uvs = np.empty((num_faces * 3, 2), dtype=np.float32)
+    uvs[corner_order] = decompress_texture_coords(compressed_coords)
+    uvs[corner_order[compressed_coords == _NO_UV_MARKER]] = 0.0
+
+    return uvs
+
 
-    for vertex_idx in range(num_vertices):
-        try:
-            flag = reader.read_uint8()
-            corners = vertex_corners[vertex_idx]
+def _scan_flag_offsets(data: bytes, corner_counts: list[int]) -> list[int]:
+    """Find the offset of the flag byte of each vertex in texture coordinate data.
+
+    :param data: The raw binary texture coordinate data.
+    :param corner_counts: The number of face corners around each vertex.
+    :return: The byte offset of the flag of each vertex.
+    :raises ValueError: If a flag does not match its vertex or the data ends early.
+    """
+    # This is the only part of the parse that has to run byte by byte, as each flag decides where the next one is.
+    # The loop does the bare minimum per vertex; running past the end of the data is detected afterwards.
+    flag_offsets: list[int] = []
+    append_offset = flag_offsets.append
+    offset = 0
+
+    try:
+        for num_corners in corner_counts:
+            flag = data[offset]
+            append_offset(offset)
 
             if flag == 1:
                 # Single UV shared by all corners
-                compressed = reader.read_uint32()
-                if compressed != _NO_UV_MARKER:
-                    u, v = decompress_texture_coord(compressed)
-                    for corner_idx in corners:
-                        uvs[corner_idx] = [u, v]
-            else:
+                offset += 5
+            elif flag == 0xFF or flag == num_corners:
                 # Multiple UVs (one per face)
-                if flag != 0xFF:
-                    num_faces_for_vertex = len(corners)
-                    if flag != num_faces_for_vertex:
-                        raise ValueError(
-                            f"Mismatch at vertex {vertex_idx}: flag={flag}, expected={num_faces_for_vertex}"
-                        )
-
-                corners_sorted = sorted(corners, key=lambda c: c // 3)
-                for corner_idx in corners_sorted:
-                    compressed = reader.read_uint32()
-                    if compressed != _NO_UV_MARKER:
-                        u, v = decompress_texture_coord(compressed)
-                        uvs[corner_idx] = [u, v]
-
-        except EOFError as e:
-            raise ValueError(f"Unexpected end of texture data at vertex {vertex_idx}/{num_vertices}") from e
+                offset += 1 + 4 * num_corners
+            else:
+                vertex_idx = len(flag_offsets) - 1
+                raise ValueError(f"Mismatch at vertex {vertex_idx}: flag={flag}, expected={num_corners}")
+    except IndexError:
+        pass
 
-    return uvs
+    # The data ended either within the coordinates of the last scanned vertex, or right before the next flag.
+    num_vertices = len(corner_counts)
+    if offset > len(data):
+        raise ValueError(f"Unexpected end of texture data at vertex {len(flag_offsets) - 1}/{num_vertices}")
+
+    if len(flag_offsets) < num_vertices:
+        raise ValueError(f"Unexpected end of texture data at vertex {len(flag_offsets)}/{num_vertices}")
+
+    return flag_offsets
+
+
+def load_texture_image(data: bytes, flip_vertical: bool = False) -> Image.Image:
+    """Decode an HPS texture image and convert it from BGR to RGB.
+
+    :param data: The raw texture image data (JPEG or PNG in BGR format).
+    :param flip_vertical: Whether to also flip the image vertically, e.g. for bottom-left UV origins.
+    :return: The decoded image in RGB format.
+    """
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(data))
+    if image.mode in ("1", "L"):
+        # Swapping identical channels is a no-op.
+        image = image.convert("RGB")
+        return image.transpose(Image.Transpose.FLIP_TOP_BOTTOM) if flip_vertical else image
+
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+
+    bands = image.split()
+    if flip_vertical:
+        # Flipping the single-channel bands lets the merge write the flipped image in one pass.
+        bands = tuple(band.transpose(Image.Transpose.FLIP_TOP_BOTTOM) for band in bands)
+
+    r, g, b = bands
+    return Image.merge("RGB", (b, g, r))
 
 
 def face_colors_to_vertex_colors(mesh: HPSMesh) -> npt.NDArray[np.uint8]:
@@ -146,19 +240,14 @@ def face_colors_to_vertex_colors(mesh: HPSMesh) -> npt.NDArray[np.uint8]:
     :param mesh: The mesh containing face colors.
     :return: An array of vertex colors (N, 3).
     """
-    vertex_colors = np.zeros((mesh.num_vertices, 3), dtype=np.float32)
-    vertex_counts = np.zeros(mesh.num_vertices, dtype=np.int32)
-
-    for face_idx, face in enumerate(mesh.faces):
-        face_color = mesh.face_colors[face_idx].astype(np.float32)
-        for vertex_idx in face:
-            vertex_colors[vertex_idx] += face_color
-            vertex_counts[vertex_idx] += 1
+    corner_colors = np.repeat(mesh.face_colors, 3, axis=0)
+    color_sums, face_counts = _sum_corner_colors(mesh.faces.ravel(), corner_colors, mesh.num_vertices)
 
-    mask = vertex_counts > 0
-    vertex_colors[mask] /= vertex_counts[mask, np.newaxis]
+    vertex_colors = np.zeros((mesh.num_vertices, 3), dtype=np.uint8)
+    mask = face_counts > 0
+    vertex_colors[mask] = (color_sums[mask] / face_counts[mask, np.newaxis]).astype(np.uint8)
 
-    return vertex_colors.astype(np.uint8)
+    return vertex_colors
 
 
 def texture_to_vertex_colors(mesh: HPSMesh) -> npt.NDArray[np.uint8]:
@@ -173,44 +262,53 @@ def texture_to_vertex_colors(mesh: HPSMesh) -> npt.NDArray[np.uint8]:
     if len(mesh.texture_images) > 1:
         logger.warning("Multiple texture images found; using the first one only.")
 
+    from PIL import Image
+
+    # Only the sampled texels need their BGR channels reversed, so the image is decoded as stored rather than
+    # swapping every pixel with load_texture_image first.
     image = Image.open(io.BytesIO(mesh.texture_images[0]))
     if image.mode != "RGB":
         image = image.convert("RGB")
 
-    r, g, b = image.split()
-    image = Image.merge("RGB", (b, g, r))
-
     width, height = image.size
-    image_array = np.array(image, dtype=np.uint8)
+    image_array = np.asarray(image)
 
-    num_faces = mesh.num_faces
-    uv_coords = mesh.uv.reshape(num_faces, 3, 2)
+    uv_coords = mesh.uv.reshape(mesh.num_faces * 3, 2)
+    xs = np.clip(uv_coords[:, 0] * (width - 1), 0, width - 1).astype(np.intp)
+    ys = np.clip(uv_coords[:, 1] * (height - 1), 0, height - 1).astype(np.intp)
 
-    vertex_color_samples: dict[int, list[npt.NDArray[np.uint8]]] = {}
-    for face_idx, face in enumerate(mesh.faces):
-        for corner_idx in range(3):
-            vertex_idx = int(face[corner_idx])
-            u, v = uv_coords[face_idx, corner_idx]
+    # Gathering whole pixels from the flattened image is much faster than indexing rows and columns separately.
+    pixel_indices = ys * width + xs
+    corner_colors = np.take(image_array.reshape(-1, 3), pixel_indices, axis=0)[:, ::-1]
+    color_sums, sample_counts = _sum_corner_colors(mesh.faces.ravel(), corner_colors, mesh.num_vertices)
 
-            x = int(np.clip(u * (width - 1), 0, width - 1))
-            y = int(np.clip(v * (height - 1), 0, height - 1))
+    vertex_colors = np.full((mesh.num_vertices, 3), 128, dtype=np.uint8)
+    sampled = sample_counts > 0
+    vertex_colors[sampled] = (color_sums[sampled] / sample_counts[sampled, np.newaxis]).astype(np.uint8)
 
-            color = image_array[y, x]
-            if vertex_idx not in vertex_color_samples:
-                vertex_color_samples[vertex_idx] = []
+    return vertex_colors
 
-            vertex_color_samples[vertex_idx].append(color)
 
-    vertex_colors = np.zeros((mesh.num_vertices, 3), dtype=np.uint8)
-    for vertex_idx in range(mesh.num_vertices):
-        if vertex_idx in vertex_color_samples:
-            samples = vertex_color_samples[vertex_idx]
-            avg_color = np.mean(samples, axis=0).astype(np.uint8)
-            vertex_colors[vertex_idx] = avg_color
-        else:
-            vertex_colors[vertex_idx] = [128, 128, 128]
+def _sum_corner_colors(
+    vertex_indices: npt.NDArray[np.integer],
+    corner_colors: npt.NDArray[np.uint8],
+    num_vertices: int,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.intp]]:
+    """Sum the colors of all face corners around each vertex.
 
-    return vertex_colors
+    :param vertex_indices: The vertex index of each face corner (K,).
+    :param corner_colors: The RGB color of each face corner (K, 3).
+    :param num_vertices: The number of vertices in the mesh.
+    :return: The per-vertex color sums (N, 3) and the number of corners around each vertex (N,).
+    """
+    # Weighted bincounts sum exactly (the sums of 8-bit values fit a double) and are much faster than np.add.at.
+    counts = np.bincount(vertex_indices, minlength=num_vertices)[:num_vertices]
+    sums = np.empty((num_vertices, 3), dtype=np.float64)
+    for channel in range(3):
+        channel_sums = np.bincount(vertex_indices, weights=corner_colors[:, channel], minlength=num_vertices)
+        sums[:, channel] = channel_sums[:num_vertices]
+
+    return sums, counts
 
 
 def deduplicate_vertices_for_uv(
@@ -229,30 +327,24 @@ def deduplicate_vertices_for_uv(
     :param uv_coords: The UV coordinates per face corner (M, 3, 2).
     :return: (new_vertices, new_uvs, new_faces) where indices align.
     """
-    vertex_uv_map: dict[tuple[int, tuple[float, float]], int] = {}
-    new_vertices: list[npt.NDArray[np.floating]] = []
-    new_uvs: list[tuple[float, float]] = []
-    new_faces: list[list[int]] = []
-
-    for face_idx, face in enumerate(faces):
-        new_face = []
-        for corner_idx in range(3):
-            vertex_idx = int(face[corner_idx])
-            uv = tuple(float(x) for x in uv_coords[face_idx, corner_idx])
-
-            key = (vertex_idx, uv)
-            if key not in vertex_uv_map:
-                unique_idx = len(new_vertices)
-                vertex_uv_map[key] = unique_idx
-                new_vertices.append(vertices[vertex_idx])
-                new_uvs.append(uv)
-
-            new_face.append(vertex_uv_map[key])
-
-        new_faces.append(new_face)
+    corner_vertices = faces.ravel()
+    # Adding zero turns -0.0 into 0.0, so UVs that compare equal also have equal bit patterns.
+    corner_uvs = np.ascontiguousarray(uv_coords, dtype=np.float32).reshape(-1, 2) + np.float32(0.0)
+
+    # Number the distinct UV pairs by their bit patterns, then pack each (vertex, UV) pair into one integer key so the
+    # combinations can be found with a plain sort instead of hashing tuples.
+    _, uv_ids = np.unique(corner_uvs.view(np.uint64).ravel(), return_inverse=True)
+    keys = (corner_vertices.astype(np.uint64) << np.uint64(32)) | uv_ids.astype(np.uint64)
+    _, first_corners, corner_keys = np.unique(keys, return_index=True, return_inverse=True)
+
+    # np.unique orders the combinations by key; renumber them in order of first use instead.
+    order = np.argsort(first_corners)
+    ranks = np.empty_like(order)
+    ranks[order] = np.arange(order.shape[0])
+    first_corners = first_corners[order]
 
     return (
-        np.array(new_vertices, dtype=np.float32),
-        np.array(new_uvs, dtype=np.float32),
-        np.array(new_faces, dtype=np.int32),
+        vertices[corner_vertices[first_corners]].astype(np.float32),
+        corner_uvs[first_corners],
+        ranks[corner_keys].reshape(-1, 3).astype(np.int32),
     )
@@ -0,0 +1,76 @@
+import pytest
+from Crypto.Cipher import Blowfish
+
+from hpsdecode.encryption import BlowfishDecryptor, scramble_key, swap_endianness
+
+
+class TestSwapEndianness:
+    """Tests for swapping the byte order of the 32-bit words in each block."""
+
+    def test_swap_full_blocks(self) -> None:
+        """Reverse the bytes of both words in every 8-byte block."""
+        data = bytes(range(16))
+
+        swapped = swap_endianness(data)
+
+        assert swapped == bytes([3, 2, 1, 0, 7, 6, 5, 4, 11, 10, 9, 8, 15, 14, 13, 12])
+
+    def test_keep_partial_block(self) -> None:
+        """Leave a trailing partial block unchanged."""
+        data = bytes(range(11))
+
+        swapped = swap_endianness(data)
+
+        assert swapped == bytes([3, 2, 1, 0, 7, 6, 5, 4, 8, 9, 10])
+
+    def test_swap_is_reversible(self) -> None:
+        """Swapping twice restores the original data."""
+        data = bytes(range(40))
+
+        assert swap_endianness(swap_endianness(data)) == data
+
+
+class TestScrambleKey:
+    """Tests for scrambling encryption keys."""
+
+    def test_scramble_key(self) -> None:
+        """Reverse the key and XOR each byte with 123."""
+        assert scramble_key(b"\x01\x02\x03") == bytes([3 ^ 123, 2 ^ 123, 1 ^ 123])
+
+
+class TestBlowfishDecryptor:
+    """Tests for decrypting Blowfish data with endianness correction."""
+
+    @staticmethod
+    def _reference_decrypt(key: bytes, data: bytes) -> bytes:
+        """Decrypt zero-padded data by swapping the words around a plain Blowfish ECB decryption."""
+        padded = data + bytes(-len(data) % 8)
+        return swap_endianness(Blowfish.new(key, Blowfish.MODE_ECB).decrypt(swap_endianness(padded)))
+
+    @pytest.mark.parametrize("size", [1, 8, 13, 40])
+    def test_decrypt_matches_reference(self, size: int) -> None:
+        """Decrypt padded data the same as a plain Blowfish decryption with swapped words."""
+        key = b"secret key"
+        data = bytes(range(size))
+
+        expected = self._reference_decrypt(key, data)
+
+        assert BlowfishDecryptor(key).decrypt(data) == expected
+        assert BlowfishDecryptor(key).decrypt(data, original_size=size) == expected[:size]
+
+    def test_decrypt_into_matches_reference(self) -> None:
+        """Write the padded plaintext to the buffer."""
+        key = b"secret key"
+        data = bytes(range(13))
+
+        output = bytearray(16)
+        BlowfishDecryptor(key).decrypt_into(data, output)
+
+        assert bytes(output) == self._reference_decrypt(key, data)
+
+    def test_decrypt_into_rejects_wrong_buffer_size(self) -> None:
+        """Raise an error when the buffer does not have the padded length of the data."""
+        decryptor = BlowfishDecryptor(b"secret key")
+
+        with pytest.raises(ValueError, match="Expected an output buffer of 16 bytes"):
+            decryptor.decrypt_into(bytes(13), bytearray(13))
@@ -1,15 +1,39 @@
+import io
 import struct
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from hpsdecode.export import ExportFormat, export_mesh
+from hpsdecode.export.base import write_rows
 from hpsdecode.export.obj import MaterialConfig, OBJExporter
 from hpsdecode.export.ply import PLYExporter
 from hpsdecode.export.stl import STLExporter
 from hpsdecode.mesh import HPSMesh
 
 
+class TestWriteRows:
+    """Tests for writing formatted rows in chunks."""
+
+    def test_chunks_match_single_write(self) -> None:
+        """Write the same text regardless of how the rows are chunked."""
+        rows = np.arange(15, dtype=np.float32).reshape(5, 3) / 7
+        template = "v %.6f %.6f %.6f\n"
+
+        chunked = io.StringIO()
+        write_rows(chunked, template, rows, chunk_rows=2)
+
+        assert chunked.getvalue() == "".join(template % tuple(row) for row in rows.tolist())
+
+    def test_no_rows(self) -> None:
+        """Write nothing for an empty array."""
+        output = io.StringIO()
+        write_rows(output, "%d\n", np.empty((0, 1), dtype=np.int32))
+
+        assert output.getvalue() == ""
+
+
 class TestSTLExporter:
     """Tests for the STL format exporter."""
 
@@ -205,6 +229,18 @@ class TestOBJExporter:
         assert len(vertex_lines) == 3
         assert len(parts) == 7  # v x y z r g b
 
+    def test_line_formatting(self, colored_mesh: HPSMesh, tmp_path: Path) -> None:
+        """Format vertex positions, colors, and one-based face indices."""
+        exporter = OBJExporter(include_colors=True, include_textures=False)
+        output_path = tmp_path / "test.obj"
+
+        exporter.export(colored_mesh, output_path)
+
+        lines = output_path.read_text().splitlines()
+
+        assert "v 1.000000 0.000000 0.000000 0.0000 1.0000 0.0000" in lines
+        assert lines[-1] == "f 1 2 3"
+
     def test_texture_files_created(self, textured_mesh: HPSMesh, tmp_path: Path) -> None:
         """Create OBJ, MTL, and PNG files for textured mesh."""
         exporter = OBJExporter(include_textures=True)
@@ -268,6 +304,18 @@ class TestOBJExporter:
 
         assert "Ns 64.0" in content
 
+    def test_texture_compress_level(self, textured_mesh: HPSMesh, tmp_path: Path) -> None:
+        """Encode the texture PNG with the configured compression level."""
+        exporter = OBJExporter(include_textures=True, texture_compress_level=9)
+        output_path = tmp_path / "test.obj"
+
+        exporter.export(textured_mesh, output_path)
+
+        png_data = (tmp_path / "test.png").read_bytes()
+        zlib_header = png_data[png_data.index(b"IDAT") + 4 :][:2]
+
+        assert zlib_header == b"\x78\xda"  # Maximum compression
+
 
 class TestExportFormat:
     """Tests for ExportFormat enum and extension parsing."""
@@ -3,8 +3,10 @@ from pathlib import Path
 
 import pytest
 
+import hpsdecode.commands as hpc
 from hpsdecode import load_hps
 from hpsdecode.exceptions import HPSParseError, HPSSchemaError
+from hpsdecode.schemas.cc import COMMANDS_WITHOUT_PAYLOAD
 
 #: An HPS 'Packed_geometry' XML string representing a mesh with three vertices and one triangle.
 SIMPLE_PACKED_GEOMETRY_XML = """
@@ -60,6 +62,26 @@ TEXTURED_MESH_XML = f"""
 </HPS>
 """
 
+#: An HPS XML string with texture images in several locations, listed after their lower-priority counterparts.
+MULTIPLE_TEXTURE_LOCATIONS_XML = f"""
+<HPS version="1.1">
+    {SIMPLE_PACKED_GEOMETRY_XML}
+    <TextureImages>
+        <TextureImage>Yw==</TextureImage>
+    </TextureImages>
+    <PartialTextureData>
+        <TextureImages>
+            <TextureImage>Yg==</TextureImage>
+        </TextureImages>
+    </PartialTextureData>
+    <TextureData2>
+        <TextureImages>
+            <AdditionalTextureImage>YQ==</AdditionalTextureImage>
+        </TextureImages>
+    </TextureData2>
+</HPS>
+"""
+
 #: An HPS XML string representing a mesh with a single spline.
 MESH_WITH_SPLINE_XML = f"""
 <HPS version="1.1">
@@ -142,6 +164,13 @@ class TestLoadHPS:
         assert mesh.num_vertices == 3
         assert mesh.num_faces == 1
 
+    def test_load_from_bytes(self) -> None:
+        """Load mesh from raw bytes."""
+        packed, mesh = load_hps(SIMPLE_MESH_XML.encode())
+
+        assert mesh.num_vertices == 3
+        assert mesh.num_faces == 1
+
     def test_ca_schema(self) -> None:
         """Load CA schema mesh."""
         packed, mesh = load_hps(io.BytesIO(SIMPLE_MESH_XML.encode()))
@@ -250,6 +279,27 @@ class TestLoadHPS:
         with pytest.raises(HPSParseError, match="Vertex count mismatch"):
             load_hps(io.BytesIO(mismatch_xml.encode()))
 
+    def test_invalid_base64_raises_error(self) -> None:
+        """Raise HPSParseError when binary data is not valid base64."""
+        invalid_xml = SIMPLE_MESH_XML.replace(">BA==<", ">BA=<")
+
+        with pytest.raises(HPSParseError, match="Invalid base64 data"):
+            load_hps(io.BytesIO(invalid_xml.encode()))
+
+    def test_invalid_integer_attribute_raises_error(self) -> None:
+        """Raise HPSParseError when a numeric attribute is not an integer."""
+        invalid_xml = SIMPLE_MESH_XML.replace('vertex_count="3"', 'vertex_count="three"')
+
+        with pytest.raises(HPSParseError, match="'vertex_count' .* not an integer"):
+            load_hps(io.BytesIO(invalid_xml.encode()))
+
+    def test_truncated_face_command_raises_error(self) -> None:
+        """Raise HPSParseError when a face command payload is cut off."""
+        truncated_xml = SIMPLE_MESH_XML.replace(">BA==<", ">BQAB<")
+
+        with pytest.raises(HPSParseError, match="Expected 6 bytes of vertex indices"):
+            load_hps(io.BytesIO(truncated_xml.encode()))
+
     def test_face_count_mismatch_raises_error(self) -> None:
         """Raise HPSParseError when face count doesn't match data."""
         mismatch_xml = """
@@ -312,6 +362,12 @@ class TestLoadHPSWithTextures:
         assert mesh.uv.shape[0] > 0
         assert mesh.uv.shape[1] == 2
 
+    def test_texture_image_location_order(self) -> None:
+        """Collect texture images by location priority rather than document order."""
+        packed, _ = load_hps(io.BytesIO(MULTIPLE_TEXTURE_LOCATIONS_XML.encode()))
+
+        assert packed.texture_images == [b"a", b"b", b"c"]
+
 
 class TestLoadHPSWithSplines:
     """Tests for loading meshes with spline data."""
@@ -408,3 +464,57 @@ class TestLoadHPSWithSplines:
 
         assert not mesh.has_splines
         assert len(mesh.splines) == 0
+
+    def test_missing_spline_property_raises_error(self) -> None:
+        """Raise HPSParseError when a required spline property is missing."""
+        invalid_xml = MESH_WITH_SPLINE_XML.replace('<Property name="Radius" value="0.25"/>', "")
+
+        with pytest.raises(HPSParseError, match="name='Radius'"):
+            load_hps(io.BytesIO(invalid_xml.encode()))
+
+    def test_parse_xml_control_points(self) -> None:
+        """Parse control points stored as XML vector objects."""
+        xml_control_points = """
+            <ControlPoints>
+                <Object><Vector name="p" x="0.0" y="0.0" z="1.0"/></Object>
+                <Object><Vector name="p" x="0.5" y="1.0" z="0.0"/></Object>
+            </ControlPoints>
+        """
+        xml = MESH_WITH_SPLINE_XML.replace(
+            "<ControlPointsPacked>AAAAAAAAAAAAAAAAAACAPwAAAAAAAAAAAAAAPwAAgD8AAAAA</ControlPointsPacked>",
+            xml_control_points,
+        )
+
+        _, mesh = load_hps(io.BytesIO(xml.encode()))
+
+        assert mesh.splines[0].control_points.tolist() == [[0.0, 0.0, 1.0], [0.5, 1.0, 0.0]]
+
+    def test_parse_packed_control_points_with_whitespace(self) -> None:
+        """Parse packed control points surrounded by whitespace."""
+        packed = "AAAAAAAAAAAAAAAAAACAPwAAAAAAAAAAAAAAPwAAgD8AAAAA"
+        xml = MESH_WITH_SPLINE_XML.replace(packed, f"\n    {packed}\n")
+
+        _, mesh = load_hps(io.BytesIO(xml.encode()))
+
+        assert mesh.splines[0].num_control_points == 3
+
+    def test_empty_packed_control_points_raises_error(self) -> None:
+        """Raise HPSParseError when packed control points contain only whitespace."""
+        packed = "AAAAAAAAAAAAAAAAAACAPwAAAAAAAAAAAAAAPwAAgD8AAAAA"
+        xml = MESH_WITH_SPLINE_XML.replace(packed, "\n    ")
+
+        with pytest.raises(HPSParseError, match="no content"):
+            load_hps(io.BytesIO(xml.encode()))
+
+
+class TestFaceCommandTable:
+    """Tests for the table of face commands without a payload."""
+
+    def test_keys_are_face_command_types(self) -> None:
+        """Key every command by its face command type, so opcode lookups find it."""
+        assert all(isinstance(opcode, hpc.FaceCommandType) for opcode in COMMANDS_WITHOUT_PAYLOAD)
+
+    def test_keys_match_command_types(self) -> None:
+        """Map each opcode to the command class of that type."""
+        for opcode, command_type in COMMANDS_WITHOUT_PAYLOAD.items():
+            assert command_type().op == opcode
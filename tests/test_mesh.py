@@ -1,3 +1,5 @@
+import numpy as np
+
 from hpsdecode.mesh import HPSMesh
 
 
@@ -54,3 +56,16 @@ class TestHPSMesh:
         assert not empty_mesh.has_vertex_colors
         assert not empty_mesh.has_face_colors
         assert not empty_mesh.has_textures
+
+    def test_geometry_dtypes_are_normalized(self) -> None:
+        """Store vertices as float32 and faces as int32 regardless of input dtype."""
+        mesh = HPSMesh(
+            vertices=np.zeros((3, 3), dtype=np.float64),
+            faces=np.array([[0, 1, 2]], dtype=np.int64),
+            vertex_colors=np.array([]),
+            face_colors=np.array([]),
+            uv=np.array([]),
+        )
+
+        assert mesh.vertices.dtype == np.float32
+        assert mesh.faces.dtype == np.int32
@@ -1,11 +1,16 @@
+import io
+
 import numpy as np
 import pytest
+from PIL import Image
 
 from hpsdecode.mesh import HPSMesh
 from hpsdecode.texture import (
     decompress_texture_coord,
+    decompress_texture_coords,
     deduplicate_vertices_for_uv,
     face_colors_to_vertex_colors,
+    load_texture_image,
     parse_texture_coords,
     texture_to_vertex_colors,
 )
@@ -68,6 +73,25 @@ class TestTextureCoordDecompression:
         assert u == pytest.approx(0.5, abs=1e-4)
         assert v == -256.0
 
+    def test_decompress_batch_matches_scalar(self) -> None:
+        """Decompress a batch of coordinates to the same values as one at a time."""
+        compressed = np.array([0x00000000, 0x7FFF7FFF, 0x3FFF3FFF, 0x80008000, 0xFFFFFFFF, 0x80003FFF], dtype=np.uint32)
+
+        uvs = decompress_texture_coords(compressed)
+
+        assert uvs.dtype == np.float32
+        assert uvs.tolist() == [list(np.float32(decompress_texture_coord(int(c)))) for c in compressed]
+
+    def test_decompress_batch_covers_every_component(self) -> None:
+        """Decompress every 16-bit component to the same value as the scalar path."""
+        bits = np.arange(1 << 16, dtype=np.uint32)
+
+        uvs = decompress_texture_coords(bits | (bits << 16))
+
+        expected = [np.float32(decompress_texture_coord(int(b))[0]) for b in bits]
+        assert uvs[:, 0].tolist() == expected
+        assert uvs[:, 1].tolist() == expected
+
 
 class TestParseTextureCoords:
     """Tests for parsing texture coordinates from binary data."""
@@ -162,6 +186,29 @@ class TestParseTextureCoords:
             parse_texture_coords(bytes(data), num_vertices, faces)
 
 
+class TestLoadTextureImage:
+    """Tests for decoding BGR texture images."""
+
+    def test_swaps_bgr_to_rgb(self, textured_mesh: HPSMesh) -> None:
+        """Reverse the channel order of the decoded image."""
+        image = load_texture_image(textured_mesh.texture_images[0])
+
+        assert image.mode == "RGB"
+        assert image.getpixel((0, 0)) == (64, 128, 255)
+
+    def test_flip_vertical(self) -> None:
+        """Flip the rows of the image along with the channel swap."""
+        pixels = np.array([[[1, 2, 3]], [[4, 5, 6]]], dtype=np.uint8)
+
+        buffer = io.BytesIO()
+        Image.fromarray(pixels).save(buffer, format="PNG")
+
+        image = load_texture_image(buffer.getvalue(), flip_vertical=True)
+
+        assert image.getpixel((0, 0)) == (6, 5, 4)
+        assert image.getpixel((0, 1)) == (3, 2, 1)
+
+
 class TestFaceColorsToVertexColors:
     """Tests for converting face colors to vertex colors."""
 